@@ -0,0 +1,71 @@
+"""Shared fixtures for the pdf_fetcher_v2 unit tests."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+# pdf_fetcher_v2 lives in a dated folder that is not an importable package
+PDF_FETCHER_V2_PATH = (
+    Path(__file__).resolve().parents[1]
+    / 'web_fetcher' / '.backup_20251218_132023' / 'pdf_fetcher_v2.py'
+)
+
+
+@pytest.fixture(scope='session')
+def v2():
+    """The pdf_fetcher_v2 module, loaded from its file path."""
+    spec = importlib.util.spec_from_file_location('pdf_fetcher_v2', PDF_FETCHER_V2_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['pdf_fetcher_v2'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def fetcher(v2, tmp_path):
+    """A PDFFetcher on a temp directory with no pacing delays."""
+    f = v2.PDFFetcher(
+        pdf_dir=tmp_path / 'pdfs',
+        metadata_path=tmp_path / 'pdfs' / 'metadata.json',
+        delay_between_requests=0,
+        delay_between_batches=0,
+    )
+    yield f
+    f.close()
+
+
+class FakeResponse:
+    """Streaming requests.Response stand-in; an Exception in chunks is raised mid-stream."""
+
+    def __init__(self, status_code=200, chunks=(), headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._chunks = chunks
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for chunk in self._chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'HTTP {self.status_code}', response=self)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def serve(fetcher, monkeypatch):
+    """Make the fetcher's session answer every GET with the given FakeResponse."""
+    def install(*args, **kwargs):
+        response = FakeResponse(*args, **kwargs)
+        monkeypatch.setattr(fetcher.session, 'get', lambda *a, **kw: response)
+        return response
+
+    return install
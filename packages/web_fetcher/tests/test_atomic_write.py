@@ -0,0 +1,139 @@
+"""Tests that interrupted or rejected downloads leave nothing on disk."""
+
+import pytest
+import requests
+
+URL = 'https://example.org/x.pdf'
+
+
+def _chunks(*items):
+    for item in items:
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def test_write_stream_atomically(v2, tmp_path):
+    output = tmp_path / 'out' / 'x.pdf'
+
+    size = v2._write_stream_atomically(output, b'%PDF', _chunks(b'-1.7', b'', b' body'))
+
+    assert output.read_bytes() == b'%PDF-1.7 body'
+    assert size == len(b'%PDF-1.7 body')
+    assert [p.name for p in output.parent.iterdir()] == ['x.pdf']
+
+
+@pytest.mark.parametrize('error', [requests.ConnectionError('reset'), KeyboardInterrupt()])
+def test_failed_stream_leaves_no_file_and_no_temp_file(v2, tmp_path, error):
+    output = tmp_path / 'x.pdf'
+
+    with pytest.raises(type(error)):
+        v2._write_stream_atomically(output, b'%PDF', _chunks(b'-1.7', error))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_stream_keeps_the_previous_file(v2, tmp_path):
+    output = tmp_path / 'x.pdf'
+    output.write_bytes(b'%PDF-1.4 old')
+
+    with pytest.raises(requests.ConnectionError):
+        v2._write_stream_atomically(output, b'%PDF', _chunks(requests.ConnectionError('reset')))
+
+    assert [p.name for p in tmp_path.iterdir()] == ['x.pdf']
+    assert output.read_bytes() == b'%PDF-1.4 old'
+
+
+def _download(fetcher, tmp_path):
+    return fetcher.download_manager.download(URL, tmp_path / 'pdfs' / 'x.pdf')
+
+
+def _files(tmp_path):
+    return sorted(p.name for p in (tmp_path / 'pdfs').iterdir() if p.suffix in ('.pdf', '.tmp'))
+
+
+def test_download_writes_the_pdf(fetcher, serve, tmp_path):
+    serve(200, chunks=[b'%PDF-1.7', b' body'])
+
+    assert _download(fetcher, tmp_path)
+    assert (tmp_path / 'pdfs' / 'x.pdf').read_bytes() == b'%PDF-1.7 body'
+    assert _files(tmp_path) == ['x.pdf']
+
+
+@pytest.mark.parametrize('chunks', [
+    [b'%PDF-1.7', b' partial', requests.ConnectionError('reset')],  # after the header
+    [b'%P', requests.ConnectionError('reset')],                      # during the header sniff
+])
+def test_download_interrupted_mid_stream_leaves_nothing(fetcher, serve, tmp_path, chunks):
+    serve(200, chunks=chunks)
+
+    assert not _download(fetcher, tmp_path)
+    assert _files(tmp_path) == []
+
+
+def test_non_pdf_body_is_rejected_before_writing(fetcher, serve, tmp_path):
+    response = serve(200, chunks=[b'<html>', b'paywall'])
+
+    assert not _download(fetcher, tmp_path)
+    assert response.closed
+    assert _files(tmp_path) == []
+
+
+def test_pdf_error_response_interrupted_mid_stream_leaves_nothing(fetcher, serve, tmp_path):
+    serve(403, chunks=[b'%PDF-1.7', requests.ConnectionError('reset')])
+
+    assert not _download(fetcher, tmp_path)
+    assert _files(tmp_path) == []
+
+
+def test_download_failure_keeps_an_existing_pdf(fetcher, serve, tmp_path):
+    output = tmp_path / 'pdfs' / 'x.pdf'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(b'%PDF-1.4 old')
+    serve(200, chunks=[b'%PDF-1.7', requests.ConnectionError('reset')])
+
+    assert not _download(fetcher, tmp_path)
+    assert output.read_bytes() == b'%PDF-1.4 old'
+    assert _files(tmp_path) == ['x.pdf']
+
+
+class FakeBrowser:
+    """Driver that lands on a plain page; the download itself is faked."""
+
+    current_url = 'https://example.org/article/x'
+    title = 'Article'
+    page_source = '<html></html>'
+
+    def execute_cdp_cmd(self, *args):
+        pass
+
+    def get(self, url):
+        pass
+
+
+@pytest.mark.parametrize('cross_device', [False, True])
+def test_selenium_download_is_moved_into_place(v2, tmp_path, monkeypatch, cross_device):
+    download_dir = tmp_path / 'downloads'
+    download_dir.mkdir()
+    downloaded = download_dir / 'x.pdf'
+    downloaded.write_bytes(b'%PDF-1.7 body')
+    output = tmp_path / 'pdfs' / 'x.pdf'
+
+    manager = v2.DownloadManager(requests.Session(), v2.RateLimiter(), selenium_download_dir=download_dir)
+    monkeypatch.setattr(manager, '_wait_for_download', lambda directory, timeout: downloaded)
+    monkeypatch.setattr(v2.time, 'sleep', lambda seconds: None)
+    if cross_device:
+        real_replace = v2.os.replace
+
+        def replace(src, dst):
+            # Renaming out of the download dir fails as it would across devices
+            if src == downloaded:
+                raise OSError(18, 'Invalid cross-device link')
+            real_replace(src, dst)
+
+        monkeypatch.setattr(v2.os, 'replace', replace)
+
+    assert manager._download_with_selenium(URL, output, FakeBrowser())
+    assert output.read_bytes() == b'%PDF-1.7 body'
+    assert [p.name for p in output.parent.iterdir()] == ['x.pdf']
+    assert list(download_dir.iterdir()) == []
@@ -0,0 +1,54 @@
+"""Tests for domain interleaving and the order of batch results."""
+
+import pytest
+
+
+@pytest.fixture
+def recorded(v2, fetcher, monkeypatch):
+    """Replace download() with a stub recording the order identifiers run in."""
+    order = []
+
+    def fake_download(identifier):
+        order.append(identifier)
+        return v2.DownloadResult(identifier=identifier, status=v2.DownloadStatus.SUCCESS)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    return order
+
+
+# Two Elsevier DOIs, then two PLOS DOIs (predicted domains differ)
+IDENTIFIERS = ['10.1016/a', '10.1016/b', '10.1371/c', '10.1371/d']
+
+
+def test_sort_identifiers_by_domain_interleaves(fetcher):
+    assert fetcher._sort_identifiers_by_domain(IDENTIFIERS) == [
+        '10.1016/a', '10.1371/c', '10.1016/b', '10.1371/d'
+    ]
+
+
+def test_sort_by_domain_is_off_by_default(fetcher, recorded):
+    fetcher.download_batch(IDENTIFIERS, retry_failures=False, prefetch_crossref=False)
+    assert recorded == IDENTIFIERS
+
+
+def test_sorted_batch_returns_results_in_input_order(fetcher, recorded):
+    results = fetcher.download_batch(
+        IDENTIFIERS, sort_by_domain=True, retry_failures=False, prefetch_crossref=False
+    )
+    assert recorded == ['10.1016/a', '10.1371/c', '10.1016/b', '10.1371/d']
+    assert [r.identifier for r in results] == IDENTIFIERS
+
+
+def test_prefiltered_and_postponed_results_keep_input_order(v2, fetcher, recorded):
+    existing = fetcher.pdf_dir / f"{fetcher._sanitized_name('10.1371/d', '')}.pdf"
+    existing.write_bytes(b'%PDF-1.7')
+    fetcher._add_cloudflare_domain('sciencedirect.com')
+
+    results = fetcher.download_batch(
+        IDENTIFIERS, retry_failures=False, prefilter=True, prefetch_crossref=False, postpone_cloudflare=True
+    )
+
+    # Postponed Elsevier DOIs run last; the existing PDF is never downloaded
+    assert recorded == ['10.1371/c', '10.1016/a', '10.1016/b']
+    assert [r.identifier for r in results] == IDENTIFIERS
+    assert results[3].status == v2.DownloadStatus.ALREADY_EXISTS
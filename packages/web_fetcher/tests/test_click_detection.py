@@ -0,0 +1,70 @@
+"""Tests for detecting a PDF opened by clicking a landing page button."""
+
+import time
+import types
+
+import pytest
+
+LANDING_URL = 'https://doi.org/10.1000/x'
+
+
+class FakeElement:
+    def __init__(self, on_click):
+        self.on_click = on_click
+
+    def click(self):
+        self.on_click()
+
+
+class FakeDriver:
+    """Single-window browser: scripts scroll, click, or report the content type."""
+
+    def __init__(self, current_url, content_type='text/html'):
+        self.current_url = current_url
+        self.content_type = content_type
+        self.window_handles = ['main']
+        self.current_window_handle = 'main'
+        self.page_source = '<html></html>'
+
+    def execute_script(self, script, *args):
+        if 'click()' in script:
+            args[0].click()
+        elif 'contentType' in script:
+            return self.content_type
+        return None
+
+
+@pytest.fixture
+def no_scroll_pause(v2, monkeypatch):
+    monkeypatch.setattr(v2, 'time', types.SimpleNamespace(**{**vars(time), 'sleep': lambda seconds: None}))
+
+
+def _finder(v2, driver):
+    return v2.PDFLinkFinder(driver, v2.RateLimiter())
+
+
+def test_click_navigating_to_a_pdf_is_detected(v2, no_scroll_pause):
+    driver = FakeDriver('https://example.org/article/x')
+
+    def navigate():
+        driver.current_url = 'https://example.org/content/x.pdf'
+
+    assert _finder(v2, driver)._click_and_detect_pdf(FakeElement(navigate)) == 'https://example.org/content/x.pdf'
+
+
+def test_earlier_redirect_is_not_mistaken_for_click_navigation(v2, no_scroll_pause):
+    # The landing page redirected to a viewer URL that looks like a PDF link;
+    # the click itself goes nowhere
+    driver = FakeDriver('https://example.org/doi/pdf/10.1000/x')
+    assert driver.current_url != LANDING_URL
+
+    assert _finder(v2, driver)._click_and_detect_pdf(FakeElement(lambda: None)) is None
+
+
+def test_click_opening_a_pdf_in_place_is_detected(v2, no_scroll_pause):
+    driver = FakeDriver('https://example.org/article/x')
+
+    def open_inline():
+        driver.content_type = 'application/pdf'
+
+    assert _finder(v2, driver)._click_and_detect_pdf(FakeElement(open_inline)) == 'https://example.org/article/x'
@@ -0,0 +1,187 @@
+"""Tests for concurrent batch downloads, cancellation and the driver lock."""
+
+import threading
+import time
+
+import pytest
+
+# One DOI per predicted domain (Elsevier, Nature, Springer, PLOS)
+DIFFERENT_DOMAINS = ['10.1016/a', '10.1038/b', '10.1007/c', '10.1371/d']
+
+
+def _lock_is_free(lock):
+    """Whether another thread could take lock right now."""
+    free = []
+
+    def probe():
+        acquired = lock.acquire(blocking=False)
+        free.append(acquired)
+        if acquired:
+            lock.release()
+
+    thread = threading.Thread(target=probe)
+    thread.start()
+    thread.join()
+    return free[0]
+
+
+def _succeed(v2, identifier):
+    return v2.DownloadResult(identifier=identifier, status=v2.DownloadStatus.SUCCESS)
+
+
+def test_workers_download_concurrently_and_keep_input_order(v2, fetcher, monkeypatch):
+    # Every download waits for all the others: this only passes if they overlap
+    barrier = threading.Barrier(len(DIFFERENT_DOMAINS), timeout=5)
+
+    def fake_download(identifier):
+        barrier.wait()
+        return _succeed(v2, identifier)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    results = fetcher.download_batch(DIFFERENT_DOMAINS, max_workers=4, prefetch_crossref=False)
+
+    assert [r.identifier for r in results] == DIFFERENT_DOMAINS
+    assert all(r.status == v2.DownloadStatus.SUCCESS for r in results)
+
+
+def test_same_domain_downloads_are_paced(v2, fetcher, monkeypatch):
+    fetcher.delay_between_requests = 0.2
+    started = {}
+
+    def fake_download(identifier):
+        started[identifier] = time.monotonic()
+        return _succeed(v2, identifier)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    fetcher.download_batch(['10.1016/a', '10.1016/b', '10.1371/c'], max_workers=3, prefetch_crossref=False)
+
+    assert abs(started['10.1016/b'] - started['10.1016/a']) >= 0.19
+    # Another domain does not wait behind the Elsevier pair
+    assert started['10.1371/c'] - min(started['10.1016/a'], started['10.1016/b']) < 0.15
+
+
+def test_cancelled_downloads_are_neither_persisted_nor_counted(v2, fetcher, monkeypatch, caplog):
+    attempted = []
+
+    def fake_download(identifier):
+        attempted.append(identifier)
+        fetcher.cancel()
+        return _succeed(v2, identifier)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    with caplog.at_level('INFO', logger=v2.logger.name):
+        results = fetcher.download_batch(['10.1016/a', '10.1016/b', '10.1016/c'], prefetch_crossref=False)
+
+    assert attempted == ['10.1016/a']
+    assert [r.status for r in results] == [
+        v2.DownloadStatus.SUCCESS, v2.DownloadStatus.CANCELLED, v2.DownloadStatus.CANCELLED
+    ]
+    assert fetcher.metadata_store.get('10.1016/b') is None
+    assert '1 succeeded, 0 already existed, 0 failed' in caplog.text
+    assert '2 downloads cancelled' in caplog.text
+
+
+def test_cancelled_retry_keeps_the_original_failure(v2, fetcher, monkeypatch):
+    calls = []
+
+    def fake_download(identifier):
+        calls.append(identifier)
+        if len(calls) == 3:
+            # First retry: stop the batch before the second one starts
+            fetcher.cancel()
+        return v2.DownloadResult(identifier=identifier, error_reason=f'attempt {len(calls)}')
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    results = fetcher.download_batch(['10.1016/a', '10.1016/b'], prefetch_crossref=False)
+
+    assert calls == ['10.1016/a', '10.1016/b', '10.1016/a']
+    assert [(r.status, r.error_reason) for r in results] == [
+        (v2.DownloadStatus.FAILURE, 'attempt 3'),
+        (v2.DownloadStatus.FAILURE, 'attempt 2'),
+    ]
+
+
+def test_interrupt_does_not_wait_for_running_downloads(v2, fetcher, monkeypatch):
+    slow_started = threading.Event()
+    release = threading.Event()
+
+    def fake_download(identifier):
+        if identifier == '10.1016/interrupt':
+            slow_started.wait(5)
+            raise KeyboardInterrupt
+        slow_started.set()
+        release.wait(5)
+        return _succeed(v2, identifier)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    start = time.monotonic()
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            fetcher.download_batch(['10.1016/interrupt', '10.1371/slow'], max_workers=2, prefetch_crossref=False)
+        assert time.monotonic() - start < 2
+        assert fetcher._stop_event.is_set()
+    finally:
+        release.set()
+
+
+class FakeDriver:
+    """Browser stand-in that checks the driver lock is held while it is used."""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.visited = []
+
+    def get(self, url):
+        assert not _lock_is_free(self.lock)
+        self.visited.append(url)
+
+    def get_cookies(self):
+        assert not _lock_is_free(self.lock)
+        return [{'name': 'session', 'value': '1'}]
+
+
+def test_driver_lock_is_released_during_http_download(v2, fetcher, monkeypatch):
+    doi = '10.1000/x'
+    fetcher.resolution_cache.put('landing', f'https://doi.org/{doi}', 'https://example.org/landing')
+    fetcher.resolution_cache.put('crossref_pdf', doi, 'https://cdn.example.org/x.pdf')
+    fetcher._needs_cookies_domains.add('cdn.example.org')
+
+    driver = FakeDriver(fetcher._driver_lock)
+    monkeypatch.setattr(fetcher, '_get_driver', lambda: driver)
+    monkeypatch.setattr(fetcher, '_wait_for_page_load', lambda driver: None)
+    downloads = []
+
+    def fake_download(pdf_url, output_path, cookies=None, referer=None, selenium_driver=None):
+        downloads.append((cookies, selenium_driver, _lock_is_free(fetcher._driver_lock)))
+        output_path.write_bytes(b'%PDF-1.7')
+        return True
+
+    monkeypatch.setattr(fetcher.download_manager, 'download', fake_download)
+    result = fetcher.download(doi)
+
+    assert result.status == v2.DownloadStatus.SUCCESS
+    assert driver.visited == ['https://example.org/landing']
+    assert downloads == [([{'name': 'session', 'value': '1'}], driver, True)]
+    assert _lock_is_free(fetcher._driver_lock)
+
+
+def test_selenium_fallback_holds_the_driver_lock(v2, fetcher, monkeypatch, tmp_path):
+    manager = fetcher.download_manager
+    held = []
+
+    class Refused:
+        status_code = 403
+        headers = {}
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(manager.session, 'get', lambda *args, **kwargs: Refused())
+    monkeypatch.setattr(
+        manager, '_download_with_selenium',
+        lambda *args, **kwargs: held.append(not _lock_is_free(fetcher._driver_lock)) or True,
+    )
+
+    assert manager.download('https://example.org/x.pdf', tmp_path / 'x.pdf', selenium_driver=object())
+    assert held == [True]
+    assert _lock_is_free(fetcher._driver_lock)
@@ -0,0 +1,103 @@
+"""Tests for batch Crossref PDF URL prefetching."""
+
+import threading
+
+import pytest
+
+
+class FakeCrossrefFetcher:
+    """Stand-in for CrossrefBibliographicFetcher keyed by DOI."""
+
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch_by_doi(self, doi):
+        with self._lock:
+            self.calls.append(doi)
+        record = self.records.get(doi)
+        if isinstance(record, Exception):
+            raise record
+        return record
+
+
+def _pdf_link(url):
+    return {'link': [{'URL': url, 'content-type': 'application/pdf'}]}
+
+
+@pytest.fixture
+def crossref(fetcher):
+    """Install a fake Crossref client on the fetcher."""
+    fake = FakeCrossrefFetcher({
+        '10.1000/pdf': _pdf_link('https://example.org/a.pdf'),
+        '10.1000/nolink': {'link': [{'URL': 'https://example.org/a.html', 'content-type': 'text/html'}]},
+        '10.1000/error': RuntimeError('boom'),
+    })
+    fetcher._crossref_fetcher = fake
+    fetcher._crossref_initialized = True
+    return fake
+
+
+def test_prefetch_uses_crossref_client(fetcher, crossref):
+    fetcher.session.get = None  # no hand-rolled HTTP through the session
+    fetcher._prefetch_crossref(['10.1000/pdf', 'https://doi.org/10.1000/pdf', '10.1000/nolink'])
+
+    assert sorted(crossref.calls) == ['10.1000/nolink', '10.1000/pdf']
+    assert fetcher.resolution_cache.get('crossref_pdf', '10.1000/pdf') == 'https://example.org/a.pdf'
+    assert fetcher.resolution_cache.get('crossref_pdf', '10.1000/nolink') == ''
+
+
+def test_failed_or_missing_lookups_are_not_cached(fetcher, crossref):
+    fetcher._prefetch_crossref(['10.1000/error', '10.1000/unknown'])
+
+    assert fetcher.resolution_cache.get('crossref_pdf', '10.1000/error') is None
+    assert fetcher.resolution_cache.get('crossref_pdf', '10.1000/unknown') is None
+
+
+def test_cached_and_non_doi_identifiers_are_skipped(fetcher, crossref):
+    fetcher.resolution_cache.put('crossref_pdf', '10.1000/pdf', 'https://example.org/cached.pdf')
+    fetcher._prefetch_crossref(['10.1000/pdf', 'https://example.org/paper.pdf', 'not an identifier'])
+
+    assert crossref.calls == []
+
+
+def test_client_not_created_when_nothing_to_prefetch(v2, fetcher, monkeypatch):
+    monkeypatch.setattr(v2, 'CROSSREF_AVAILABLE', True)
+    fetcher.resolution_cache.put('crossref_pdf', '10.1000/pdf', '')
+    fetcher._prefetch_crossref(['10.1000/pdf'])
+
+    assert not fetcher._crossref_initialized
+
+
+@pytest.fixture
+def batch_prefetches(v2, fetcher, monkeypatch):
+    """Run a one-DOI batch and report whether it prefetched from Crossref."""
+    prefetched = []
+    monkeypatch.setattr(fetcher, '_prefetch_crossref', prefetched.append)
+    monkeypatch.setattr(
+        fetcher, 'download',
+        lambda identifier: v2.DownloadResult(identifier=identifier, status=v2.DownloadStatus.SUCCESS),
+    )
+
+    def run(**kwargs):
+        fetcher.download_batch(['10.1000/pdf'], retry_failures=False, **kwargs)
+        return bool(prefetched)
+
+    return run
+
+
+def test_batch_does_not_prefetch_by_default(v2, fetcher, monkeypatch, batch_prefetches):
+    monkeypatch.setattr(v2, 'CROSSREF_AVAILABLE', True)
+    assert not batch_prefetches()
+
+
+def test_batch_prefetches_when_asked(v2, monkeypatch, batch_prefetches):
+    monkeypatch.setattr(v2, 'CROSSREF_AVAILABLE', True)
+    assert batch_prefetches(prefetch_crossref=True)
+
+
+def test_batch_skips_prefetch_without_crossref(v2, fetcher, monkeypatch, batch_prefetches):
+    monkeypatch.setattr(v2, 'CROSSREF_AVAILABLE', False)
+    assert not batch_prefetches(prefetch_crossref=True)
+    assert not fetcher._crossref_initialized
@@ -0,0 +1,47 @@
+"""Tests for how download() records unsuccessful outcomes."""
+
+import pytest
+
+DOI = '10.1000/x'
+
+
+@pytest.fixture
+def persisted(fetcher, monkeypatch):
+    """Record every result download() hands to the metadata store."""
+    updates = []
+    monkeypatch.setattr(fetcher.metadata_store, 'update', updates.append)
+    return updates
+
+
+def test_unresolvable_identifier_is_recorded_once(v2, fetcher, persisted, monkeypatch):
+    def unresolvable(url, use_selenium=False, selenium_driver=None):
+        raise RuntimeError('no route')
+
+    def no_browser():
+        raise RuntimeError('no browser')
+
+    monkeypatch.setattr(fetcher.doi_resolver, 'resolve', unresolvable)
+    monkeypatch.setattr(fetcher, '_get_driver', no_browser)
+
+    result = fetcher.download(DOI)
+
+    assert result.status == v2.DownloadStatus.INVALID_IDENTIFIER
+    assert result.error_reason.startswith('Failed to resolve identifier')
+    assert persisted == [result]
+
+
+def test_unexpected_error_is_recorded_once(v2, fetcher, persisted, monkeypatch):
+    fetcher.resolution_cache.put('landing', f'https://doi.org/{DOI}', 'https://example.org/landing')
+    fetcher.resolution_cache.put('crossref_pdf', DOI, 'https://example.org/x.pdf')
+
+    def broken_download(pdf_url, output_path, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(fetcher.download_manager, 'download', broken_download)
+
+    result = fetcher.download(DOI)
+
+    assert result.status == v2.DownloadStatus.FAILURE
+    assert result.error_reason == 'disk full'
+    assert persisted == [result]
+
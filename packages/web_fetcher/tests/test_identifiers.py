@@ -0,0 +1,37 @@
+"""Tests for identifier normalization and DOI filenames."""
+
+import pytest
+
+
+@pytest.mark.parametrize('url, doi', [
+    ('https://doi.org/10.1016/j.x.2020.1', '10.1016/j.x.2020.1'),
+    ('https://dx.doi.org/10.1038/nature12373', '10.1038/nature12373'),
+    ('https://doi.org/10.1002/(SICI)1097-0258(19980815/30)17:15/16<1661::AID-SIM968>3.0.CO;2-2',
+     '10.1002/(SICI)1097-0258(19980815/30)17:15/16<1661::AID-SIM968>3.0.CO;2-2'),
+    ('https://doi.org/10.1000/abc?via=ihub', '10.1000/abc'),
+    ('https://doi.org/10.1000/abc#section', '10.1000/abc'),
+    ('https://doi.org/10.1000/abc.', '10.1000/abc'),
+    # Prefix-only URLs still match
+    ('https://doi.org/10.1016', '10.1016'),
+])
+def test_doi_url_captures_the_full_doi(v2, url, doi):
+    assert v2.IdentifierNormalizer.normalize(url) == ('doi_url', doi, url)
+
+
+def test_doi_urls_from_one_registrant_get_distinct_filenames(v2):
+    """Regression: doi.org URLs used to normalize to the bare registrant prefix."""
+    names = {
+        v2.PDFFetcher._sanitized_name(v2.IdentifierNormalizer.normalize(url)[1], url)
+        for url in ('https://doi.org/10.1016/j.a.1', 'https://doi.org/10.1016/j.b.2')
+    }
+    assert names == {'10.1016_j.a.1', '10.1016_j.b.2'}
+
+
+def test_doi_url_and_bare_doi_share_a_filename(v2):
+    kind, doi, url = v2.IdentifierNormalizer.normalize('10.1016/j.a.1')
+    _, url_doi, doi_url = v2.IdentifierNormalizer.normalize('https://doi.org/10.1016/j.a.1')
+    assert v2.PDFFetcher._sanitized_name(doi, url) == v2.PDFFetcher._sanitized_name(url_doi, doi_url)
+
+
+def test_sanitize_for_filename(v2):
+    assert v2.IdentifierNormalizer.sanitize_for_filename('10.1/a\\b<c>d:e"f|g?h*i') == '10.1_a_b_c_d_e_f_g_h_i'
@@ -0,0 +1,30 @@
+"""Tests for classifying a loaded landing page."""
+
+import pytest
+
+
+def _probe_raising(error):
+    def probe(driver):
+        raise error
+    return probe
+
+
+def test_paywall_is_classified(fetcher, monkeypatch):
+    monkeypatch.setattr(fetcher, '_get_page_probe', lambda driver: ('Article', '', '', True))
+    assert fetcher._classify_landing_page(driver=None) == 'paywall'
+
+
+def test_challenge_is_classified(fetcher, monkeypatch):
+    monkeypatch.setattr(fetcher, '_get_page_probe', lambda driver: ('Just a moment...', '', '', False))
+    assert fetcher._classify_landing_page(driver=None) == 'cloudflare'
+
+
+def test_browser_error_leaves_page_unclassified(fetcher, monkeypatch):
+    monkeypatch.setattr(fetcher, '_get_page_probe', _probe_raising(RuntimeError('no such window')))
+    assert fetcher._classify_landing_page(driver=None) is None
+
+
+def test_interrupt_is_not_swallowed(fetcher, monkeypatch):
+    monkeypatch.setattr(fetcher, '_get_page_probe', _probe_raising(KeyboardInterrupt()))
+    with pytest.raises(KeyboardInterrupt):
+        fetcher._classify_landing_page(driver=None)
@@ -0,0 +1,38 @@
+"""Tests for remembering hosts that refuse cookie-less PDF downloads."""
+
+import pytest
+
+DOI = '10.1000/x'
+PDF_URL = 'https://cdn.example.org/x.pdf'
+
+
+@pytest.fixture
+def failing_download(fetcher, monkeypatch):
+    """Resolve DOI from the caches and make the PDF download fail with a given status."""
+    fetcher.resolution_cache.put('landing', f'https://doi.org/{DOI}', 'https://example.org/landing')
+    fetcher.resolution_cache.put('crossref_pdf', DOI, PDF_URL)
+
+    def fail_with(status):
+        def fake_download(pdf_url, output_path, **kwargs):
+            fetcher.download_manager._local.http_status = status
+            return False
+
+        monkeypatch.setattr(fetcher.download_manager, 'download', fake_download)
+        return fetcher.download(DOI)
+
+    return fail_with
+
+
+@pytest.mark.parametrize('status', [401, 403])
+def test_refused_download_marks_host(fetcher, failing_download, status):
+    result = failing_download(status)
+
+    assert result.error_reason == f'Download failed: HTTP {status}'
+    assert fetcher._needs_cookies_domains == {'cdn.example.org'}
+
+
+@pytest.mark.parametrize('status', [None, 404, 500])
+def test_other_failures_do_not_mark_host(fetcher, failing_download, status):
+    failing_download(status)
+
+    assert fetcher._needs_cookies_domains == set()
@@ -0,0 +1,89 @@
+"""Tests for postponing identifiers on Cloudflare-protected domains."""
+
+import pytest
+
+
+def test_nothing_postponed_by_default(fetcher):
+    assert not fetcher._is_postponed('10.1016/j.x.2020.1')
+    assert not fetcher._is_postponed('https://www.sciencedirect.com/science/article/pii/X')
+
+
+def test_subdomain_matches_postponed_parent(fetcher):
+    fetcher._add_cloudflare_domain('aps.org')
+    assert fetcher._is_postponed('https://link.aps.org/doi/10.1103/x')
+    assert fetcher._is_postponed('https://aps.org/paper.pdf')
+
+
+def test_www_and_port_are_stripped(fetcher):
+    fetcher._add_cloudflare_domain('WWW.Example.COM:8080')
+    assert fetcher._cloudflare_domains == {'example.com'}
+    assert fetcher._is_postponed('https://www.example.com:443/paper.pdf')
+
+
+def test_suffix_matching_respects_label_boundaries(fetcher):
+    fetcher._add_cloudflare_domain('aps.org')
+    assert not fetcher._is_postponed('https://myaps.org/paper.pdf')
+
+
+def test_bare_tld_never_matches(fetcher):
+    fetcher._add_cloudflare_domain('org')
+    assert not fetcher._is_postponed('https://link.aps.org/paper.pdf')
+
+
+def test_domain_suffixes(fetcher):
+    assert fetcher._domain_suffixes('www.link.aps.org') == ('link.aps.org', 'aps.org')
+    assert fetcher._domain_suffixes('localhost') == ()
+
+
+def test_doi_postponed_by_predicted_domain(fetcher):
+    fetcher._add_cloudflare_domain('sciencedirect.com')
+    assert fetcher._is_postponed('10.1016/j.x.2020.1')
+    assert fetcher._is_postponed('https://doi.org/10.1016/j.x.2020.1')
+    assert not fetcher._is_postponed('10.1371/journal.pone.1')
+
+
+def test_doi_prefix_alone_is_never_postponed(fetcher):
+    # A challenge on one unmapped publisher must not defer its whole registrant
+    fetcher._add_cloudflare_domain('journals.example.org')
+    assert not fetcher._is_postponed('10.9999/x')
+
+
+def test_set_postponed_domains(fetcher):
+    fetcher.set_postponed_domains(['www.aps.org', ''])
+    assert fetcher._cloudflare_domains == {'aps.org'}
+    assert fetcher._is_postponed('https://journals.aps.org/x')
+
+    fetcher.set_postponed_domains([])
+    assert not fetcher._is_postponed('https://journals.aps.org/x')
+
+
+@pytest.fixture
+def recorded(v2, fetcher, monkeypatch):
+    order = []
+
+    def fake_download(identifier):
+        order.append(identifier)
+        return v2.DownloadResult(identifier=identifier, status=v2.DownloadStatus.SUCCESS)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    return order
+
+
+BATCH = ['10.1016/a', '10.1371/b', '10.1016/c']
+
+
+def test_batch_does_not_postpone_by_default(fetcher, recorded):
+    fetcher._add_cloudflare_domain('sciencedirect.com')
+    fetcher.download_batch(BATCH, retry_failures=False)
+    assert recorded == BATCH
+
+
+def test_batch_postpones_when_asked(fetcher, recorded):
+    fetcher._add_cloudflare_domain('sciencedirect.com')
+    fetcher.download_batch(BATCH, retry_failures=False, postpone_cloudflare=True)
+    assert recorded == ['10.1371/b', '10.1016/a', '10.1016/c']
+
+
+def test_invalid_identifier_is_not_postponed(fetcher):
+    fetcher._add_cloudflare_domain('aps.org')
+    assert not fetcher._is_postponed('not an identifier')
@@ -0,0 +1,59 @@
+"""Tests for skipping identifiers whose PDF is already on disk."""
+
+import pytest
+
+
+def _pdf_path(fetcher, doi):
+    return fetcher.pdf_dir / f"{fetcher._sanitized_name(doi, 'https://doi.org/' + doi)}.pdf"
+
+
+def test_prefilter_splits_valid_truncated_and_missing(fetcher):
+    valid, truncated, html, missing = '10.1/valid', '10.1/truncated', '10.1/html', '10.1/missing'
+    _pdf_path(fetcher, valid).write_bytes(b'%PDF-1.7 body')
+    _pdf_path(fetcher, truncated).write_bytes(b'%P')
+    _pdf_path(fetcher, html).write_bytes(b'<html>paywall</html>')
+
+    existing, remaining = fetcher._prefilter_existing([valid, truncated, html, missing])
+
+    assert existing == [(valid, _pdf_path(fetcher, valid))]
+    assert remaining == [truncated, html, missing]
+
+
+def test_prefilter_ignores_unsupported_identifiers(fetcher):
+    existing, remaining = fetcher._prefilter_existing(['not-an-identifier'])
+    assert existing == []
+    assert remaining == ['not-an-identifier']
+
+
+def test_download_batch_reports_prefiltered_pdfs_as_existing(v2, fetcher, monkeypatch):
+    valid, missing = '10.1/valid', '10.1/missing'
+    _pdf_path(fetcher, valid).write_bytes(b'%PDF-1.7 body')
+    downloaded = []
+
+    def fake_download(identifier):
+        downloaded.append(identifier)
+        return v2.DownloadResult(identifier=identifier, status=v2.DownloadStatus.SUCCESS)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    results = fetcher.download_batch([valid, missing], retry_failures=False, prefilter=True, prefetch_crossref=False)
+
+    assert downloaded == [missing]
+    by_id = {r.identifier: r for r in results}
+    assert by_id[valid].status == v2.DownloadStatus.ALREADY_EXISTS
+    assert by_id[valid].pdf_path == _pdf_path(fetcher, valid)
+    assert by_id[missing].status == v2.DownloadStatus.SUCCESS
+    # Prefiltered items are persisted like any other outcome
+    assert fetcher.metadata_store.get(valid)['status'] == 'already_exists'
+
+
+def test_download_batch_does_not_prefilter_by_default(v2, fetcher, monkeypatch):
+    _pdf_path(fetcher, '10.1/valid').write_bytes(b'%PDF-1.7 body')
+    monkeypatch.setattr(fetcher, '_prefilter_existing', lambda identifiers: pytest.fail('prefiltered'))
+    monkeypatch.setattr(
+        fetcher, 'download',
+        lambda identifier: v2.DownloadResult(identifier=identifier, status=v2.DownloadStatus.ALREADY_EXISTS),
+    )
+
+    results = fetcher.download_batch(['10.1/valid'], retry_failures=False, prefetch_crossref=False)
+
+    assert [r.status for r in results] == [v2.DownloadStatus.ALREADY_EXISTS]
@@ -0,0 +1,168 @@
+"""Tests for the per-domain token-bucket RateLimiter."""
+
+import types
+
+import pytest
+
+DOMAIN = 'example.org'
+
+
+class FakeClock:
+    """Replaces the time module: sleeps are recorded and (optionally) advance the clock."""
+
+    def __init__(self, advance_on_sleep=True):
+        self.now = 1000.0
+        self.sleeps = []
+        self.advance_on_sleep = advance_on_sleep
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        if self.advance_on_sleep:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(v2, monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(v2, 'time', types.SimpleNamespace(time=fake.time, sleep=fake.sleep))
+    return fake
+
+
+def _limiter(v2, requests_per_second=1.0, capacity=1.0, jitter=(0.0, 0.0)):
+    return v2.RateLimiter(requests_per_second, jitter=jitter, capacity=capacity)
+
+
+def test_first_request_does_not_wait(v2, clock):
+    _limiter(v2).wait_if_needed(DOMAIN)
+    assert clock.sleeps == []
+
+
+def test_capacity_one_spaces_requests(v2, clock):
+    limiter = _limiter(v2, requests_per_second=2.0)
+    limiter.wait_if_needed(DOMAIN)
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [0.5]
+
+
+def test_burst_up_to_capacity(v2, clock):
+    limiter = _limiter(v2, capacity=3.0)
+    for _ in range(4):
+        limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [1.0]
+
+
+def test_bucket_refills_over_time(v2, clock):
+    limiter = _limiter(v2, capacity=3.0)
+    for _ in range(3):
+        limiter.wait_if_needed(DOMAIN)
+    clock.now += 2.0  # two tokens back
+    limiter.wait_if_needed(DOMAIN)
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == []
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [1.0]
+
+
+def test_refill_is_capped_at_capacity(v2, clock):
+    limiter = _limiter(v2, capacity=2.0)
+    limiter.wait_if_needed(DOMAIN)
+    clock.now += 3600
+    for _ in range(3):
+        limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [1.0]
+
+
+def test_queued_callers_take_successive_slots(v2, clock):
+    # Concurrent callers: none of them has slept yet when the next arrives
+    clock.advance_on_sleep = False
+    limiter = _limiter(v2)
+    for _ in range(3):
+        limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [1.0, 2.0]
+    assert limiter.last_request_time[DOMAIN] == clock.now + 2.0
+
+
+def test_domains_are_independent(v2, clock):
+    limiter = _limiter(v2)
+    limiter.wait_if_needed(DOMAIN)
+    limiter.wait_if_needed('other.org')
+    assert clock.sleeps == []
+
+
+def test_jitter_only_when_waiting(v2, clock):
+    limiter = _limiter(v2, jitter=(0.25, 0.25))
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == []
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [1.25]
+
+
+def test_429_halves_the_rate(v2, clock):
+    limiter = _limiter(v2)
+    limiter.wait_if_needed(DOMAIN)
+    limiter.record_throttled(DOMAIN)
+    limiter.wait_if_needed(DOMAIN)
+    assert limiter.backoff[DOMAIN] == 2.0
+    assert clock.sleeps == [2.0]
+
+
+def test_429_drains_the_burst(v2, clock):
+    limiter = _limiter(v2, capacity=5.0)
+    limiter.wait_if_needed(DOMAIN)
+    limiter.record_throttled(DOMAIN)
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [2.0]
+
+
+def test_backoff_is_capped(v2, clock):
+    limiter = _limiter(v2)
+    for _ in range(10):
+        limiter.record_throttled(DOMAIN)
+    assert limiter.backoff[DOMAIN] == v2.RateLimiter.MAX_BACKOFF
+
+
+def test_success_gradually_restores_the_rate(v2, clock):
+    limiter = _limiter(v2)
+    limiter.record_throttled(DOMAIN)
+    limiter.record_throttled(DOMAIN)
+    limiter.record_success(DOMAIN)
+    assert limiter.backoff == {DOMAIN: 2.0}
+    limiter.record_success(DOMAIN)
+    assert limiter.backoff == {}
+    limiter.record_success(DOMAIN)
+    assert limiter.backoff == {}
+
+
+def test_retry_after_delays_the_next_request(v2, clock):
+    limiter = _limiter(v2)
+    limiter.record_throttled(DOMAIN, retry_after=30)
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [30.0]
+    # Honoured once
+    assert DOMAIN not in limiter.not_before
+
+
+def test_retry_after_is_capped(v2, clock):
+    limiter = _limiter(v2)
+    limiter.record_throttled(DOMAIN, retry_after=10 ** 6)
+    limiter.wait_if_needed(DOMAIN)
+    assert clock.sleeps == [v2.RateLimiter.MAX_RETRY_AFTER]
+
+
+def test_min_delay_and_last_request_time_are_read_only(v2, clock):
+    limiter = _limiter(v2, requests_per_second=4.0)
+    assert limiter.min_delay == 0.25
+    limiter.wait_if_needed(DOMAIN)
+
+    snapshot = limiter.last_request_time
+    assert snapshot == {DOMAIN: clock.now}
+    snapshot[DOMAIN] = 0.0
+    assert limiter.last_request_time == {DOMAIN: clock.now}
+
+    with pytest.raises(AttributeError):
+        limiter.min_delay = 1.0
+    with pytest.raises(AttributeError):
+        limiter.last_request_time = {}
@@ -0,0 +1,135 @@
+"""Tests for the persistent DOI resolution cache."""
+
+import sqlite3
+import time
+
+
+def _rows(db_path, table):
+    with sqlite3.connect(str(db_path)) as db:
+        return dict(db.execute(f'SELECT k, v FROM {table}').fetchall())
+
+
+def test_get_put_and_flush_roundtrip(v2, tmp_path):
+    db_path = tmp_path / 'cache.sqlite'
+    cache = v2.ResolutionCache(db_path)
+    assert cache.get('landing', 'https://doi.org/10.1/a') is None
+
+    cache.put('landing', 'https://doi.org/10.1/a', 'https://pub.org/a')
+    cache.put('crossref_pdf', '10.1/a', '')
+    # Served from memory before any flush
+    assert cache.get('landing', 'https://doi.org/10.1/a') == 'https://pub.org/a'
+    assert cache.get('crossref_pdf', '10.1/a') == ''
+    assert _rows(db_path, 'landing') == {}
+    cache.close()
+
+    cache = v2.ResolutionCache(db_path)
+    assert cache.get('landing', 'https://doi.org/10.1/a') == 'https://pub.org/a'
+    assert cache.get('crossref_pdf', '10.1/a') == ''
+    cache.close()
+
+
+def test_auto_flush_when_pending_is_full(v2, tmp_path):
+    db_path = tmp_path / 'cache.sqlite'
+    cache = v2.ResolutionCache(db_path, max_pending=2)
+    cache.put('landing', 'a', 'https://pub.org/a')
+    assert _rows(db_path, 'landing') == {}
+    cache.put('landing', 'b', 'https://pub.org/b')
+    assert _rows(db_path, 'landing') == {'a': 'https://pub.org/a', 'b': 'https://pub.org/b'}
+    cache.close()
+
+
+def test_negative_and_positive_entries_expire(v2, tmp_path):
+    db_path = tmp_path / 'cache.sqlite'
+    cache = v2.ResolutionCache(db_path)
+    cache.put('crossref_pdf', 'neg', '')
+    cache.put('crossref_pdf', 'pos', 'https://pub.org/a.pdf')
+    cache.close()
+
+    cache = v2.ResolutionCache(db_path, ttl=3600, negative_ttl=0.05)
+    time.sleep(0.1)
+    assert cache.get('crossref_pdf', 'neg') is None
+    assert cache.get('crossref_pdf', 'pos') == 'https://pub.org/a.pdf'
+    cache.close()
+
+    cache = v2.ResolutionCache(db_path, ttl=0.05)
+    assert cache.get('crossref_pdf', 'pos') is None
+    cache.close()
+
+
+def test_migrates_cache_without_timestamps(v2, tmp_path):
+    db_path = tmp_path / 'cache.sqlite'
+    with sqlite3.connect(str(db_path)) as db:
+        db.execute('CREATE TABLE landing(k TEXT PRIMARY KEY, v TEXT)')
+        db.execute("INSERT INTO landing VALUES ('old', 'https://pub.org/old')")
+
+    cache = v2.ResolutionCache(db_path)
+    with sqlite3.connect(str(db_path)) as db:
+        columns = {row[1] for row in db.execute('PRAGMA table_info(landing)')}
+    assert 't' in columns
+    # Untimestamped rows are re-resolved rather than trusted
+    assert cache.get('landing', 'old') is None
+
+    cache.put('landing', 'new', 'https://pub.org/new')
+    cache.close()
+    cache = v2.ResolutionCache(db_path)
+    assert cache.get('landing', 'new') == 'https://pub.org/new'
+    cache.close()
+
+
+def test_unresolved_doi_is_not_cached(v2, fetcher, monkeypatch):
+    url = 'https://doi.org/10.1/gone'
+    # The resolver hands back the doi.org URL when the DOI does not resolve
+    monkeypatch.setattr(fetcher.doi_resolver, 'resolve', lambda u, **kw: u)
+    fetcher._crossref_initialized = True
+    fetcher._crossref_fetcher = None
+    monkeypatch.setattr(fetcher, '_get_driver', lambda: (_ for _ in ()).throw(RuntimeError('no browser')))
+
+    fetcher.download('10.1/gone')
+
+    assert fetcher.resolution_cache.get('landing', url) is None
+
+
+def test_resolved_doi_is_cached(v2, fetcher, monkeypatch):
+    url = 'https://doi.org/10.1/ok'
+    monkeypatch.setattr(fetcher.doi_resolver, 'resolve', lambda u, **kw: 'https://pub.org/ok')
+    fetcher._crossref_initialized = True
+    fetcher._crossref_fetcher = None
+    monkeypatch.setattr(fetcher, '_get_driver', lambda: (_ for _ in ()).throw(RuntimeError('no browser')))
+
+    fetcher.download('10.1/ok')
+
+    assert fetcher.resolution_cache.get('landing', url) == 'https://pub.org/ok'
+
+
+def test_is_doi_host(v2):
+    assert v2._is_doi_host('doi.org')
+    assert v2._is_doi_host('dx.doi.org:443')
+    assert not v2._is_doi_host('notdoi.org')
+    assert not v2._is_doi_host('pub.org')
+
+
+def test_in_memory_cache_writes_nothing(v2, tmp_path):
+    cache = v2.ResolutionCache(None, max_pending=1)
+    cache.put('landing', 'https://doi.org/10.1/a', 'https://example.org/a')
+    assert cache.get('landing', 'https://doi.org/10.1/a') == 'https://example.org/a'
+    cache.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetcher_keeps_cache_out_of_pdf_dir_by_default(fetcher):
+    fetcher.resolution_cache.put('landing', 'https://doi.org/10.1/a', 'https://example.org/a')
+    fetcher.resolution_cache.flush()
+    assert not [p for p in fetcher.pdf_dir.iterdir() if 'sqlite' in p.name]
+
+
+def test_fetcher_persists_cache_at_cache_path(v2, tmp_path):
+    cache_path = tmp_path / 'cache' / 'resolutions.sqlite'
+    first = v2.PDFFetcher(pdf_dir=tmp_path / 'pdfs', metadata_path=tmp_path / 'meta.json', cache_path=cache_path)
+    first.resolution_cache.put('landing', 'https://doi.org/10.1/a', 'https://example.org/a')
+    first.close()
+
+    second = v2.PDFFetcher(pdf_dir=tmp_path / 'pdfs', metadata_path=tmp_path / 'meta.json', cache_path=cache_path)
+    try:
+        assert second.resolution_cache.get('landing', 'https://doi.org/10.1/a') == 'https://example.org/a'
+    finally:
+        second.close()
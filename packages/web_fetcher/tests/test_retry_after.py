@@ -0,0 +1,87 @@
+"""Tests for honouring Retry-After on throttled downloads."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+URL = 'https://example.org/x.pdf'
+DOMAIN = 'example.org'
+
+
+def _http_date(offset_seconds):
+    return format_datetime(datetime.now(timezone.utc) + timedelta(seconds=offset_seconds), usegmt=True)
+
+
+@pytest.mark.parametrize('value, expected', [('120', 120.0), (' 7 ', 7.0), ('0', 0.0)])
+def test_parse_delay_seconds(v2, value, expected):
+    assert v2._parse_retry_after(value) == expected
+
+
+def test_parse_future_http_date(v2):
+    assert 55 <= v2._parse_retry_after(_http_date(60)) <= 60
+
+
+def test_parse_past_http_date_is_zero(v2):
+    assert v2._parse_retry_after(_http_date(-3600)) == 0.0
+
+
+@pytest.mark.parametrize('value', [None, '', '   ', 'soon', '-5', '1.5', 'Fri, 99 Foo 2024'])
+def test_parse_invalid_or_negative_is_none(v2, value):
+    assert v2._parse_retry_after(value) is None
+
+
+def _download(fetcher, tmp_path):
+    return fetcher.download_manager.download(URL, tmp_path / 'x.pdf')
+
+
+def test_429_with_retry_after_sets_not_before(fetcher, serve, tmp_path):
+    serve(429, headers={'Retry-After': '30'})
+
+    assert not _download(fetcher, tmp_path)
+    limiter = fetcher.rate_limiter
+    assert limiter.backoff[DOMAIN] == 2.0
+    assert 29 <= limiter.not_before[DOMAIN] - time.time() <= 30
+
+
+def test_429_with_http_date_retry_after(fetcher, serve, tmp_path):
+    serve(429, headers={'Retry-After': _http_date(45)})
+
+    _download(fetcher, tmp_path)
+    assert 40 <= fetcher.rate_limiter.not_before[DOMAIN] - time.time() <= 45
+
+
+def test_retry_after_is_capped(v2, fetcher, serve, tmp_path):
+    serve(429, headers={'Retry-After': '86400'})
+
+    _download(fetcher, tmp_path)
+    wait = fetcher.rate_limiter.not_before[DOMAIN] - time.time()
+    assert wait <= v2.RateLimiter.MAX_RETRY_AFTER
+
+
+@pytest.mark.parametrize('header', [{}, {'Retry-After': 'soon'}, {'Retry-After': '-5'}])
+def test_429_without_usable_retry_after_falls_back_to_backoff(fetcher, serve, tmp_path, header):
+    serve(429, headers=header)
+
+    _download(fetcher, tmp_path)
+    assert fetcher.rate_limiter.backoff[DOMAIN] == 2.0
+    assert DOMAIN not in fetcher.rate_limiter.not_before
+
+
+def test_503_with_retry_after_is_throttling(fetcher, serve, tmp_path):
+    serve(503, headers={'Retry-After': '5'})
+
+    _download(fetcher, tmp_path)
+    assert fetcher.rate_limiter.backoff[DOMAIN] == 2.0
+    assert DOMAIN in fetcher.rate_limiter.not_before
+
+
+@pytest.mark.parametrize('header', [{}, {'Retry-After': 'soon'}])
+def test_503_without_retry_after_is_a_plain_error(fetcher, serve, tmp_path, header):
+    serve(503, headers=header)
+
+    _download(fetcher, tmp_path)
+    assert DOMAIN not in fetcher.rate_limiter.backoff
+    assert DOMAIN not in fetcher.rate_limiter.not_before
+    assert fetcher.download_manager.last_http_status == 503
@@ -0,0 +1,93 @@
+"""Tests for which failed downloads are retried."""
+
+import pytest
+
+DOI = '10.1000/x'
+
+
+@pytest.fixture
+def resolved(fetcher):
+    """Resolve DOI from the caches so download() goes straight to the PDF URL."""
+    fetcher.resolution_cache.put('landing', f'https://doi.org/{DOI}', 'https://example.org/landing')
+    fetcher.resolution_cache.put('crossref_pdf', DOI, 'https://example.org/x.pdf')
+
+
+@pytest.mark.parametrize('status, retryable', [
+    ('FAILURE', True),
+    ('PDF_NOT_FOUND', False),
+    ('PAYWALL', False),
+    ('INVALID_IDENTIFIER', False),
+    ('ALREADY_EXISTS', False),
+    ('SUCCESS', False),
+    ('CANCELLED', False),
+])
+def test_only_failures_are_retryable(v2, status, retryable):
+    result = v2.DownloadResult(identifier=DOI, status=v2.DownloadStatus[status])
+    assert v2.PDFFetcher._is_retryable(result) is retryable
+
+
+def test_retryability_ignores_the_error_text(v2):
+    result = v2.DownloadResult(identifier=DOI, error_reason='Download failed: HTTP 404')
+    assert v2.PDFFetcher._is_retryable(result)
+
+
+@pytest.mark.parametrize('http_status', [404, 410])
+def test_gone_pdf_is_recorded_as_not_found(v2, fetcher, serve, resolved, http_status):
+    serve(http_status)
+    result = fetcher.download(DOI)
+
+    assert result.status == v2.DownloadStatus.PDF_NOT_FOUND
+    assert result.error_reason == f'Download failed: HTTP {http_status}'
+    assert not fetcher._is_retryable(result)
+
+
+@pytest.mark.parametrize('http_status', [403, 500])
+def test_other_http_errors_stay_retryable(v2, fetcher, serve, resolved, http_status):
+    serve(http_status)
+    result = fetcher.download(DOI)
+
+    assert result.status == v2.DownloadStatus.FAILURE
+    assert fetcher._is_retryable(result)
+
+
+def test_html_instead_of_pdf_stays_retryable(v2, fetcher, serve, resolved):
+    serve(200, chunks=[b'<html>challenge</html>'])
+    result = fetcher.download(DOI)
+
+    assert result.status == v2.DownloadStatus.FAILURE
+    assert fetcher._is_retryable(result)
+
+
+def test_unsupported_identifier_is_invalid(v2, fetcher):
+    result = fetcher.download('ftp://example.org/x.pdf')
+
+    assert result.status == v2.DownloadStatus.INVALID_IDENTIFIER
+    assert not fetcher._is_retryable(result)
+
+
+def test_batch_retries_only_retryable_failures(v2, fetcher, monkeypatch, caplog):
+    first_outcome = {
+        '10.1000/flaky': v2.DownloadStatus.FAILURE,
+        '10.1000/gone': v2.DownloadStatus.PDF_NOT_FOUND,
+        '10.1000/paywalled': v2.DownloadStatus.PAYWALL,
+        'ftp://example.org/x': v2.DownloadStatus.INVALID_IDENTIFIER,
+    }
+    calls = []
+
+    def fake_download(identifier):
+        calls.append(identifier)
+        status = first_outcome[identifier] if calls.count(identifier) == 1 else v2.DownloadStatus.SUCCESS
+        return v2.DownloadResult(identifier=identifier, status=status)
+
+    monkeypatch.setattr(fetcher, 'download', fake_download)
+    with caplog.at_level('INFO', logger=v2.logger.name):
+        results = fetcher.download_batch(list(first_outcome), prefetch_crossref=False)
+
+    assert calls == list(first_outcome) + ['10.1000/flaky']
+    assert [r.status for r in results] == [
+        v2.DownloadStatus.SUCCESS,
+        v2.DownloadStatus.PDF_NOT_FOUND,
+        v2.DownloadStatus.PAYWALL,
+        v2.DownloadStatus.INVALID_IDENTIFIER,
+    ]
+    assert '1 succeeded, 0 already existed, 3 failed' in caplog.text
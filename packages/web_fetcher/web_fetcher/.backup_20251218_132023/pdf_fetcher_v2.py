@@ -5,51 +5,305 @@ This module provides a clean, spec-compliant implementation for downloading
 PDFs from DOIs, DOI-URLs, or resource URLs.
 """
 
+import importlib.util
 import json
+import os
 import re
 import time
 import hashlib
 import tempfile
 import shutil
 import random
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
-from urllib.parse import urljoin, urlparse
-from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import urljoin
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import lru_cache
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.chrome.service import Service as ChromeService
-    from selenium.common.exceptions import (
-        TimeoutException,
-        NoSuchElementException,
-        WebDriverException
-    )
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    SELENIUM_AVAILABLE = False
-
 import logging
 logger = logging.getLogger(__name__)
 
-# Optional Crossref support
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# Selenium and the Crossref client are heavy imports that many runs (e.g.
+# pre-filtering existing PDFs) never need; they are imported on first use
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+SELENIUM_AVAILABLE = _module_available('selenium')
+
+# Optional fast JSON encoder for the metadata file (falls back to json)
 try:
-    from api_clients.crossref_client import CrossrefBibliographicFetcher
-    CROSSREF_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CROSSREF_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Optional Crossref support
+CROSSREF_AVAILABLE = _module_available('api_clients.crossref_client')
+if not CROSSREF_AVAILABLE:
     logger.debug("Crossref client not available - will skip Crossref PDF URL lookup")
 
+# Read size when streaming PDFs to disk; large enough that the per-chunk
+# Python loop and write() calls don't dominate multi-megabyte downloads
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Separator line for prominent log banners
+_BANNER_RULE = "=" * 60
+
+# Browser user agent used when none is given
+_DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+
+# Cloudflare challenge markers (checkbox CAPTCHA and challenge widgets),
+# combined into one pattern so the page is scanned in a single pass
+_CLOUDFLARE_CHALLENGE_MARKERS = (
+    'i am human',
+    "i'm not a robot",
+    'verify you are human',
+    'cf-challenge',
+    'challenge-platform',
+    'cf-chl-widget',
+    'cf-turnstile',
+)
+_CLOUDFLARE_CHALLENGE_RE = re.compile(
+    '|'.join(map(re.escape, _CLOUDFLARE_CHALLENGE_MARKERS)), re.IGNORECASE
+)
+
+# Cloudflare interstitial markers, only expected near the top of the page
+_CLOUDFLARE_INTERSTITIAL_RE = re.compile(r'just a moment|cloudflare|checking your browser', re.IGNORECASE)
+_JUST_A_MOMENT_RE = re.compile(r'just a moment', re.IGNORECASE)
+# Recorded error reasons mentioning Cloudflare (case-insensitive, no lowered copy)
+_CLOUDFLARE_REASON_RE = re.compile(r'cloudflare', re.IGNORECASE)
+
+# Challenge markers sit in the head/noscript block or in scripts appended at
+# the end of the body, so only these regions of the page source are scanned
+_CHALLENGE_SCAN_HEAD = 16384
+_CHALLENGE_SCAN_TAIL = 4096
+_INTERSTITIAL_SCAN_HEAD = 2000
+
+# Landing page phrases indicating the PDF is behind a paywall
+_PAYWALL_INDICATORS = (
+    'purchase pdf',
+    'subscription required',
+    'sign in to access',
+    'institutional access required',
+    'pay per view',
+)
+_PAYWALL_RE = re.compile('|'.join(map(re.escape, _PAYWALL_INDICATORS)), re.IGNORECASE)
+# Same alternation for evaluation in the browser (JavaScript RegExp syntax)
+_PAYWALL_JS_PATTERN = '|'.join(re.sub(r'[.*+?^${}()|\[\]\\/]', r'\\\g<0>', p) for p in _PAYWALL_INDICATORS)
+
+# Watermarking services (Silverchair) that serve PDFs via an intermediate page,
+# matched case-insensitively in one pass instead of per-check lower() copies
+_WATERMARK_URL_RE = re.compile(r'silverchair\.com|watermark', re.IGNORECASE)
+_WATERMARK_PDF_SRC_RE = re.compile(r'\.pdf|silverchair', re.IGNORECASE)
+
+# Landing page elements that link to (or reveal) the PDF
+_PDF_LINK_SELECTORS = (
+    'a[href*=".pdf"]',
+    'a[data-pdf-url]',
+    'a[pdfurl]',
+    'a[href*="/pdf/"]',
+    'a[href*="/pdfft"]',
+)
+# Collects candidate URLs for every selector in a single WebDriver round-trip
+# (href as the resolved property, like WebElement.get_attribute)
+_PDF_LINK_SCAN_JS = """
+return arguments[0].map(function (selector) {
+    return Array.from(document.querySelectorAll(selector), function (el) {
+        var href = typeof el.href === 'string' ? el.href : el.getAttribute('href');
+        return href || el.getAttribute('data-pdf-url') || el.getAttribute('pdfurl');
+    });
+});
+"""
+_PDF_BUTTON_TEXTS = ('download pdf', 'view pdf', 'pdf', 'download', 'get pdf')
+_PDF_BUTTON_TEXT_RE = re.compile('|'.join(map(re.escape, _PDF_BUTTON_TEXTS)))
+# Clickable elements with their label and link attributes, in document order,
+# in a single round-trip. Hidden elements have no visible text (as with
+# WebElement.text), so they fall back to aria-label/title.
+_CLICKABLE_SCAN_JS = """
+return Array.from(document.querySelectorAll("button, a, [role='button']"), function (el) {
+    var visible = el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    var text = (visible ? (el.innerText || '') : '').trim() ||
+        (el.getAttribute('aria-label') || '').trim() ||
+        (el.getAttribute('title') || '').trim();
+    return [
+        el,
+        text,
+        el.getAttribute('data-pdf-url') || el.getAttribute('data-href') || el.getAttribute('data-url'),
+        el.tagName,
+        typeof el.href === 'string' ? el.href : el.getAttribute('href')
+    ];
+});
+"""
+
+# Download triggers on watermarking service pages
+_WATERMARK_DOWNLOAD_XPATHS = (
+    "//a[contains(@href, '.pdf')]",
+    "//a[contains(text(), 'Download')]",
+    "//button[contains(text(), 'Download')]",
+    "//a[@download]",
+    "//*[contains(@class, 'download')]//a",
+    "//a[contains(@title, 'Download')]",
+    "//a[contains(@aria-label, 'Download')]",
+    "//a[contains(@class, 'pdf')]",
+)
+
+# PDF URLs embedded in page source, and ScienceDirect article PIIs
+_PDF_URL_RE = re.compile(r'https?://[^\s"\'<>]+\.pdf[^\s"\'<>]*', re.IGNORECASE)
+# URLs that look like a PDF: a .pdf path (optionally with a query) or any
+# /pdf path segment, which covers /pdfft and ScienceDirect's pii/.../pdfft
+_PDF_URL_SHAPE_RE = re.compile(r'\.pdf(?:\?|\Z)|/pdf', re.IGNORECASE)
+_SCIENCEDIRECT_PII_RE = re.compile(r'/science/article/pii/([A-Z0-9]+)', re.IGNORECASE)
+
+# Marks a Crossref link as a PDF (in its URL or content type)
+_PDF_HINT_RE = re.compile(r'pdf', re.IGNORECASE)
+
+# DOI registrant prefix -> publisher domain, used to predict where a DOI
+# resolves to without a network round-trip
+_DOI_PREFIX_MAP = {
+    '10.1016': 'sciencedirect.com',
+    '10.1038': 'nature.com',
+    '10.1007': 'link.springer.com',
+    '10.1002': 'onlinelibrary.wiley.com',
+    '10.1111': 'onlinelibrary.wiley.com',
+    '10.1109': 'ieeexplore.ieee.org',
+    '10.1371': 'journals.plos.org',
+    '10.1021': 'pubs.acs.org',
+    '10.48550': 'arxiv.org',
+}
+
+
+@lru_cache(maxsize=4096)
+def _url_filename_hash(url: str) -> str:
+    """
+    Derive the filename stem for a non-DOI identifier.
+    
+    MD5 is kept rather than a faster non-cryptographic hash because the stem
+    names PDFs already on disk; changing it would orphan existing downloads.
+    """
+    return hashlib.md5(url.encode()).hexdigest()[:16]
+
+
+@lru_cache(maxsize=4096)
+def _extract_doi_prefix(doi: str) -> str:
+    """Registrant prefix of a DOI ('10.1016/j.x' -> '10.1016')."""
+    return doi.partition('/')[0]
+
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    """
+    Network location of an absolute URL, as urlparse(url).netloc.
+    
+    Plain string scanning, cached because the same landing/PDF URL is
+    re-parsed by publisher detection, rate limiting and retries.
+    """
+    start = url.find('://')
+    start = 0 if start < 0 else start + 3
+    end = len(url)
+    for sep in '/?#':
+        pos = url.find(sep, start, end)
+        if pos >= 0:
+            end = pos
+    return url[start:end]
+
+
+def _read_pdf_header(path: Path) -> bytes:
+    """
+    Read the first 4 bytes of a file.
+    
+    Uses a raw file descriptor so neither the whole file nor a buffered
+    file object is created. Raises OSError if the file cannot be read.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return os.read(fd, 4)
+    finally:
+        os.close(fd)
+
+
+def _read_stream_head(chunks: Iterator[bytes], size: int = 4) -> bytes:
+    """
+    Pull chunks from a response iterator until at least size bytes are in.
+    
+    The rest of the body stays unread in chunks, so a non-PDF response can
+    be rejected without downloading it. May return fewer bytes if the body
+    is shorter.
+    """
+    head = b''
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= size:
+            break
+    return head
+
+
+def _write_stream_atomically(output_path: Path, head: bytes, chunks: Iterator[bytes]) -> int:
+    """
+    Write head plus the remaining chunks to output_path via a temp file.
+    
+    The temp file lives next to output_path, so os.replace() is a same-
+    filesystem rename: the PDF appears complete or not at all, and is never
+    copied across devices. The temp file is removed if writing fails.
+    
+    Returns:
+        Number of bytes written
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    size = len(head)
+    with tempfile.NamedTemporaryFile(dir=output_path.parent, prefix=f'.{output_path.name}.',
+                                     suffix='.tmp', delete=False) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+        try:
+            tmp_file.write(head)
+            for chunk in chunks:
+                if chunk:
+                    tmp_file.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            tmp_file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    os.replace(tmp_path, output_path)
+    return size
+
+
+def _is_doi_host(netloc: str) -> bool:
+    """Whether a URL netloc is the DOI resolver (doi.org, dx.doi.org, ...)."""
+    host = netloc.lower().partition(':')[0]
+    return host == 'doi.org' or host.endswith('.doi.org')
+
+
+def _is_valid_pdf_header(path: Path) -> bool:
+    """Check that a file starts with the PDF magic bytes (reads 4 bytes only)."""
+    try:
+        return _read_pdf_header(path) == b'%PDF'
+    except OSError:
+        return False
+
 
 class DownloadStatus(Enum):
     """Download status enumeration."""
@@ -60,6 +314,7 @@ class DownloadStatus(Enum):
     PDF_NOT_FOUND = "pdf_not_found"
     NETWORK_ERROR = "network_error"
     INVALID_IDENTIFIER = "invalid_identifier"
+    CANCELLED = "cancelled"  # Batch stopped before the download started; never persisted
 
 
 @dataclass
@@ -86,33 +341,145 @@ class DownloadResult:
         return result
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds from now.
+    
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+    
+    Returns:
+        Seconds to wait (>= 0), or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
 class RateLimiter:
-    """Per-domain rate limiter with jitter."""
+    """
+    Per-domain token-bucket rate limiter with jitter and adaptive backoff on HTTP 429.
     
-    def __init__(self, requests_per_second: float = 1.0, jitter: Tuple[float, float] = (0.5, 1.5)):
+    Each domain's bucket refills at requests_per_second up to capacity tokens,
+    so a domain that has been idle can take a short burst before requests
+    are spaced out again. Jitter is only added when a caller actually has
+    to wait.
+    """
+    
+    # Cap on how far a throttling domain's delay is stretched
+    MAX_BACKOFF = 32.0
+    # Cap on a server's Retry-After, so one host cannot stall a batch
+    MAX_RETRY_AFTER = 120.0
+    
+    def __init__(self, requests_per_second: float = 1.0, jitter: Tuple[float, float] = (0.5, 1.5),
+                 capacity: float = 1.0):
         """
         Args:
             requests_per_second: Base rate limit
             jitter: Random delay range in seconds (min, max)
+            capacity: Requests a domain may burst after being idle (1 = no burst)
         """
         self.requests_per_second = requests_per_second
         self.jitter = jitter
-        self.last_request_time: Dict[str, float] = {}
-        self.min_delay = 1.0 / requests_per_second
+        self.capacity = capacity
+        # domain -> (tokens, time.time() of last refill); tokens go negative
+        # while callers are queued for future slots
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        # domain -> time.time() its latest request was scheduled for
+        self._last_request: Dict[str, float] = {}
+        # Delay multiplier for domains that answered 429 (absent = 1.0)
+        self.backoff: Dict[str, float] = {}
+        # Earliest time.time() a domain may be contacted again (Retry-After)
+        self.not_before: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def last_request_time(self) -> Dict[str, float]:
+        """Snapshot of when each domain's latest request was scheduled (time.time())."""
+        with self._lock:
+            return dict(self._last_request)
+    
+    @property
+    def min_delay(self) -> float:
+        """Steady-state spacing between requests to one domain, in seconds."""
+        return 1.0 / self.requests_per_second
     
     def wait_if_needed(self, domain: str):
-        """Wait if needed to respect rate limit for domain."""
-        now = time.time()
-        if domain in self.last_request_time:
-            elapsed = now - self.last_request_time[domain]
-            if elapsed < self.min_delay:
-                sleep_time = self.min_delay - elapsed
+        """
+        Wait if needed to respect rate limit for domain.
+        
+        The token is taken under a lock and the sleep happens outside it,
+        so concurrent callers on one domain queue up behind each other while
+        other domains are not blocked.
+        """
+        sleep_time = 0.0
+        with self._lock:
+            now = time.time()
+            rate = self.requests_per_second / self.backoff.get(domain, 1.0)
+            tokens, last = self._buckets.get(domain, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * rate) - 1
+            if tokens < 0:
+                # Wait for this caller's token to refill
+                sleep_time = -tokens / rate
                 # Add random jitter
-                jitter = random.uniform(*self.jitter)
-                sleep_time += jitter
-                time.sleep(sleep_time)
+                sleep_time += random.uniform(*self.jitter)
+            self._buckets[domain] = (tokens, now)
+            if domain in self.not_before:
+                sleep_time = max(sleep_time, self.not_before.pop(domain) - now)
+            self._last_request[domain] = now + max(sleep_time, 0.0)
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+    
+    def record_throttled(self, domain: str, retry_after: Optional[float] = None):
+        """
+        Double the delay for a domain that answered HTTP 429.
         
-        self.last_request_time[domain] = time.time()
+        Args:
+            domain: Throttling domain
+            retry_after: Seconds the server asked us to wait, if it said
+        """
+        with self._lock:
+            factor = self.backoff.get(domain, 1.0) * 2
+            self.backoff[domain] = min(factor, self.MAX_BACKOFF)
+            # No further burst until the bucket refills at the slower rate
+            if domain in self._buckets:
+                tokens, last = self._buckets[domain]
+                self._buckets[domain] = (min(tokens, 0.0), last)
+            if retry_after is not None:
+                self.not_before[domain] = time.time() + min(retry_after, self.MAX_RETRY_AFTER)
+        logger.debug("Throttled by %s, delay factor now %s", domain, self.backoff[domain])
+    
+    def record_success(self, domain: str):
+        """Gradually restore the normal delay for a previously throttled domain."""
+        with self._lock:
+            if domain not in self.backoff:
+                return
+            factor = self.backoff[domain] / 2
+            if factor <= 1.0:
+                self.backoff.pop(domain, None)
+            else:
+                self.backoff[domain] = factor
+
+
+# Punctuation picked up around DOIs copied from prose, and DOIs in doi.org URLs
+_DOI_TRAILING_PUNCT_RE = re.compile(r'[.,;:!?)\]]+$')
+_DOI_LEADING_PUNCT_RE = re.compile(r'^[.,;:!?(\[]+')
+# Registrant prefix plus the (slash-containing) suffix, up to any query/fragment
+_DOI_URL_RE = re.compile(r'doi\.org/(10\.[^/\s?#]+(?:/[^\s?#]+)?)')
+# Path separators and characters not allowed in filenames on common
+# filesystems, all mapped to '_' in a single str.translate pass
+_FILENAME_TRANS = str.maketrans(dict.fromkeys('/\\<>:"|?*', '_'))
 
 
 class IdentifierNormalizer:
@@ -123,18 +490,16 @@ class IdentifierNormalizer:
         """Clean DOI by removing trailing/leading punctuation."""
         doi = doi.strip()
         # Remove trailing punctuation
-        doi = re.sub(r'[.,;:!?)\]]+$', '', doi)
+        doi = _DOI_TRAILING_PUNCT_RE.sub('', doi)
         # Remove leading punctuation
-        doi = re.sub(r'^[.,;:!?(\[]+', '', doi)
+        doi = _DOI_LEADING_PUNCT_RE.sub('', doi)
         return doi.strip()
     
     @staticmethod
     def sanitize_for_filename(doi: str) -> str:
         """Sanitize DOI for use in filenames."""
         # Replace slashes and other problematic chars with underscores
-        sanitized = doi.replace('/', '_').replace('\\', '_')
-        sanitized = re.sub(r'[<>:"|?*]', '_', sanitized)
-        return sanitized
+        return doi.translate(_FILENAME_TRANS)
     
     @staticmethod
     def normalize(identifier: str) -> Tuple[str, Optional[str], str]:
@@ -158,7 +523,7 @@ class IdentifierNormalizer:
             if 'doi.org/' in identifier:
                 # It's a DOI-URL
                 # Extract DOI from URL
-                match = re.search(r'doi\.org/(10\.[^/\s?#]+)', identifier)
+                match = _DOI_URL_RE.search(identifier)
                 if match:
                     doi = match.group(1)
                     cleaned_doi = IdentifierNormalizer.clean_doi(doi)
@@ -172,6 +537,30 @@ class IdentifierNormalizer:
             raise ValueError(f"Unsupported identifier format: {identifier}")
 
 
+@lru_cache(maxsize=100000)
+def _normalize_identifier_or_error(identifier: str) -> Union[Tuple[str, Optional[str], str], ValueError]:
+    """IdentifierNormalizer.normalize(), returning (rather than raising) its ValueError."""
+    try:
+        return IdentifierNormalizer.normalize(identifier)
+    except ValueError as e:
+        return e
+
+
+def _normalize_identifier(identifier: str) -> Tuple[str, Optional[str], str]:
+    """
+    Cached IdentifierNormalizer.normalize().
+    
+    An identifier is normalized by the pre-filter, the domain sort and
+    download(); the result is deterministic so it is computed once.
+    Unsupported identifiers are cached too, as their error, so every
+    pass does not re-run the full pattern match just to fail again.
+    """
+    result = _normalize_identifier_or_error(identifier)
+    if isinstance(result, ValueError):
+        raise ValueError(*result.args)
+    return result
+
+
 class CrossrefPDFExtractor:
     """Extract PDF URLs from Crossref metadata."""
     
@@ -189,18 +578,14 @@ class CrossrefPDFExtractor:
         links = metadata.get('link', [])
         
         for link in links:
-            url_val = link.get('URL', '')
-            content_type = link.get('content-type', '')
-            
-            # Check if it's a PDF link
-            is_pdf = (
-                'pdf' in url_val.lower() or 
-                'pdf' in content_type.lower() or
-                content_type == 'application/pdf'
-            )
+            url_val = link.get('URL')
+            if not url_val:
+                continue
             
-            if is_pdf:
-                logger.info(f"Found PDF URL in Crossref metadata: {url_val}")
+            # Check if it's a PDF link (content type first: it is the shorter
+            # string and the usual hit); case-insensitive search, no lower() copies
+            if _PDF_HINT_RE.search(link.get('content-type', '')) or _PDF_HINT_RE.search(url_val):
+                logger.info("Found PDF URL in Crossref metadata: %s", url_val)
                 return url_val
         
         return None
@@ -220,22 +605,46 @@ class PublisherDetector:
         'acs': ['acs.org', 'pubs.acs.org'],
     }
     
+    # Registered domain -> publisher; no domain belongs to two publishers
+    _DOMAIN_PUBLISHERS = {
+        d: publisher
+        for publisher, domains in PUBLISHER_PATTERNS.items()
+        for d in domains
+    }
+    
     @staticmethod
     def detect(url: str) -> Optional[str]:
         """Detect publisher from URL."""
-        domain = urlparse(url).netloc.lower()
-        for publisher, domains in PublisherDetector.PUBLISHER_PATTERNS.items():
-            if any(d in domain for d in domains):
+        return PublisherDetector.detect_domain(_netloc(url))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def detect_domain(domain: str) -> Optional[str]:
+        """
+        Detect publisher from an already-extracted URL netloc.
+        
+        The host and each parent domain are looked up in one dict, so a
+        domain or any subdomain of it matches (but not e.g. 'myacs.org').
+        Batches hit few distinct hosts, so results are memoized.
+        """
+        host = domain.lower().partition(':')[0]
+        while host:
+            publisher = PublisherDetector._DOMAIN_PUBLISHERS.get(host)
+            if publisher is not None:
                 return publisher
+            host = host.partition('.')[2]
         return None
 
 
 class DOIResolver:
     """Resolve DOI to landing URL."""
     
-    def __init__(self, session: requests.Session, rate_limiter: RateLimiter):
+    def __init__(self, session: requests.Session, rate_limiter: RateLimiter,
+                 driver_lock: Optional[threading.RLock] = None):
         self.session = session
         self.rate_limiter = rate_limiter
+        # Held only while the shared browser is driven, not during rate-limit waits
+        self._driver_lock = driver_lock if driver_lock is not None else threading.RLock()
     
     def resolve(self, doi_url: str, use_selenium: bool = False, 
                 selenium_driver=None) -> str:
@@ -250,19 +659,32 @@ class DOIResolver:
         Returns:
             Final landing URL after redirects
         """
-        domain = urlparse(doi_url).netloc
+        domain = _netloc(doi_url)
         self.rate_limiter.wait_if_needed(domain)
         
         if use_selenium and selenium_driver:
             try:
-                selenium_driver.get(doi_url)
-                time.sleep(2)  # Wait for redirects
-                return selenium_driver.current_url
+                with self._driver_lock:
+                    selenium_driver.get(doi_url)
+                    return self._wait_for_redirect(selenium_driver)
             except Exception as e:
-                logger.warning(f"Selenium resolution failed: {e}, falling back to requests")
+                logger.warning("Selenium resolution failed: %s, falling back to requests", e)
         
-        # Try with requests first
+        # Try with requests first. A HEAD request follows the redirect chain
+        # without downloading the landing page body; fall back to GET when the
+        # server rejects HEAD or the redirects never leave doi.org.
         try:
+            try:
+                response = self.session.head(
+                    doi_url,
+                    allow_redirects=True,
+                    timeout=30
+                )
+                if response.history and not _is_doi_host(_netloc(response.url)):
+                    return response.url
+            except requests.RequestException as e:
+                logger.debug("HEAD resolution failed: %s, retrying with GET", e)
+            
             response = self.session.get(
                 doi_url,
                 allow_redirects=True,
@@ -270,16 +692,52 @@ class DOIResolver:
             )
             return response.url
         except Exception as e:
-            logger.warning(f"Requests resolution failed: {e}")
+            logger.warning("Requests resolution failed: %s", e)
             if use_selenium and selenium_driver:
                 # Last resort: try Selenium
                 try:
-                    selenium_driver.get(doi_url)
-                    time.sleep(3)
-                    return selenium_driver.current_url
+                    with self._driver_lock:
+                        selenium_driver.get(doi_url)
+                        return self._wait_for_redirect(selenium_driver)
                 except Exception as e2:
                     raise Exception(f"Both requests and Selenium failed: {e}, {e2}")
             raise
+    
+    @staticmethod
+    def _wait_for_redirect(driver, timeout: float = 10.0, settle: float = 0.5) -> str:
+        """
+        Wait until the browser has left doi.org and its URL has settled.
+        
+        driver.get() returns once the first page has loaded, but landing
+        pages often redirect again via JavaScript. This returns as soon as
+        the URL is off doi.org and unchanged for settle seconds. On timeout
+        it returns the current URL as-is.
+        
+        Args:
+            driver: Selenium driver that was just pointed at a DOI URL
+            timeout: Maximum seconds to wait
+            settle: Seconds the URL must stay unchanged
+        
+        Returns:
+            The browser's current URL
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        seen = {'url': None, 'since': 0.0}
+        
+        def redirect_settled(d):
+            url = d.current_url
+            now = time.monotonic()
+            if url != seen['url']:
+                seen['url'], seen['since'] = url, now
+                return False
+            return url if now - seen['since'] >= settle and not _is_doi_host(_netloc(url)) else False
+        
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=0.25).until(redirect_settled)
+        except TimeoutException:
+            return driver.current_url
 
 
 class PDFLinkFinder:
@@ -326,101 +784,103 @@ class PDFLinkFinder:
     
     def _try_sciencedirect_direct(self, url: str) -> Optional[str]:
         """Try ScienceDirect direct PDF URL construction."""
-        match = re.search(r'/science/article/pii/([A-Z0-9]+)', url, re.IGNORECASE)
+        match = _SCIENCEDIRECT_PII_RE.search(url)
         if match:
             pii = match.group(1)
             pdf_url = f"https://www.sciencedirect.com/science/article/pii/{pii}/pdfft?isDTMRedir=true&download=true"
-            logger.info(f"Constructed ScienceDirect PDF URL: {pdf_url}")
+            logger.info("Constructed ScienceDirect PDF URL: %s", pdf_url)
             return pdf_url
         return None
     
     def _find_direct_links(self, url: str) -> Optional[str]:
         """Find direct PDF links."""
         try:
-            # CSS selectors for PDF links
-            selectors = [
-                'a[href*=".pdf"]',
-                'a[data-pdf-url]',
-                'a[pdfurl]',
-                'a[href*="/pdf/"]',
-                'a[href*="/pdfft"]',
-            ]
-            
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        pdf_url = element.get_attribute('href') or element.get_attribute('data-pdf-url') or element.get_attribute('pdfurl')
-                        if pdf_url:
-                            pdf_url = urljoin(url, pdf_url)
-                            if self._is_valid_pdf_url(pdf_url):
-                                logger.info(f"Found direct PDF link: {pdf_url}")
-                                return pdf_url
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            # All selectors and attributes are read in the browser in one call
+            # instead of a find_elements plus get_attribute round-trips each
+            candidates = self.driver.execute_script(_PDF_LINK_SCAN_JS, list(_PDF_LINK_SELECTORS))
+            for selector_candidates in candidates or ():
+                for pdf_url in selector_candidates:
+                    if pdf_url:
+                        pdf_url = urljoin(url, pdf_url)
+                        if self._is_valid_pdf_url(pdf_url):
+                            logger.info("Found direct PDF link: %s", pdf_url)
+                            return pdf_url
         except Exception as e:
-            logger.debug(f"Direct link search failed: {e}")
+            logger.debug("Direct link search failed: %s", e)
         
         return None
     
     def _find_via_buttons(self, url: str) -> Optional[str]:
         """Find PDF via button/link clicking."""
         try:
-            # Find all clickable elements
-            elements = self.driver.find_elements(By.XPATH, "//button | //a | //*[@role='button']")
+            # Find all clickable elements, with their text and link attributes
+            # gathered in the browser in one call rather than per element
+            clickables = self.driver.execute_script(_CLICKABLE_SCAN_JS) or []
             
-            button_texts = ['download pdf', 'view pdf', 'pdf', 'download', 'get pdf']
-            
-            for element in elements:
+            for element, element_text, data_url, tag_name, href in clickables:
                 try:
-                    # Get text from various sources
-                    element_text = ""
-                    try:
-                        element_text = element.text.strip().lower()
-                    except:
-                        pass
-                    
-                    if not element_text:
-                        element_text = (element.get_attribute('aria-label') or "").strip().lower()
-                    if not element_text:
-                        element_text = (element.get_attribute('title') or "").strip().lower()
+                    element_text = (element_text or "").lower()
                     
                     # Check if text matches PDF patterns
-                    for button_text in button_texts:
-                        if button_text in element_text:
-                            logger.info(f"Found PDF button with text: {element_text[:50]}")
-                            
-                            # Try data attributes first
-                            pdf_url = (element.get_attribute('data-pdf-url') or 
-                                      element.get_attribute('data-href') or
-                                      element.get_attribute('data-url'))
-                            if pdf_url:
-                                pdf_url = urljoin(url, pdf_url)
+                    if _PDF_BUTTON_TEXT_RE.search(element_text):
+                        logger.info("Found PDF button with text: %s", element_text[:50])
+                        
+                        # Try data attributes first
+                        pdf_url = data_url
+                        if pdf_url:
+                            pdf_url = urljoin(url, pdf_url)
+                            if self._is_valid_pdf_url(pdf_url):
+                                return pdf_url
+                        
+                        # If it's a link, get href
+                        if (tag_name or '').lower() == 'a':
+                            if href:
+                                pdf_url = urljoin(url, href)
                                 if self._is_valid_pdf_url(pdf_url):
                                     return pdf_url
-                            
-                            # If it's a link, get href
-                            if element.tag_name.lower() == 'a':
-                                href = element.get_attribute('href')
-                                if href:
-                                    pdf_url = urljoin(url, href)
-                                    if self._is_valid_pdf_url(pdf_url):
-                                        return pdf_url
-                            
-                            # Try clicking
-                            return self._click_and_detect_pdf(element, url)
+                        
+                        # Try clicking
+                        return self._click_and_detect_pdf(element)
                             
                 except Exception as e:
-                    logger.debug(f"Error processing element: {e}")
+                    logger.debug("Error processing element: %s", e)
                     continue
         except Exception as e:
-            logger.debug(f"Button search failed: {e}")
+            logger.debug("Button search failed: %s", e)
         
         return None
     
-    def _click_and_detect_pdf(self, element, current_url: str) -> Optional[str]:
-        """Click element and detect if PDF was opened."""
+    def _close_windows(self, windows: List[str], main_window: str):
+        """
+        Close windows and return focus to main_window.
+        
+        Chromium closes each target by id over CDP without switching to it
+        first; other drivers fall back to switching to and closing each one.
+        """
+        for window in windows:
+            try:
+                # In Chromium a window handle is the CDP target id
+                self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': window})
+            except Exception:
+                try:
+                    self.driver.switch_to.window(window)
+                    self.driver.close()
+                except Exception:
+                    pass
+        self.driver.switch_to.window(main_window)
+    
+    def _click_and_detect_pdf(self, element) -> Optional[str]:
+        """
+        Click element and detect if PDF was opened.
+        
+        Navigation is detected against the browser's URL just before the
+        click, not the landing URL: redirects may already have moved the
+        page, and that must not count as the click navigating.
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
         try:
             # Scroll into view
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
@@ -429,6 +889,7 @@ class PDFLinkFinder:
             # Get current window handles
             current_windows = self.driver.window_handles
             main_window = self.driver.current_window_handle
+            url_before_click = self.driver.current_url
             
             # Try to click
             clicked = False
@@ -448,25 +909,39 @@ class PDFLinkFinder:
             if not clicked:
                 return None
             
-            time.sleep(2)  # Wait for navigation
+            # Wait for navigation: a new window or a URL change, at most 2s
+            known_windows = set(current_windows)
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.2).until(
+                    lambda d: len(d.window_handles) > len(known_windows) or d.current_url != url_before_click
+                )
+            except TimeoutException:
+                pass
             
             # Check for new window
-            new_windows = self.driver.window_handles
-            if len(new_windows) > len(current_windows):
+            new_windows = [w for w in self.driver.window_handles if w not in known_windows]
+            if new_windows:
+                pdf_window_url = None
                 for window in new_windows:
-                    if window not in current_windows:
-                        self.driver.switch_to.window(window)
-                        new_url = self.driver.current_url
-                        if self._is_valid_pdf_url(new_url) or self._is_pdf_page():
-                            self.driver.close()
-                            self.driver.switch_to.window(main_window)
-                            return new_url
-                        self.driver.close()
-                        self.driver.switch_to.window(main_window)
+                    self.driver.switch_to.window(window)
+                    # A freshly opened window starts out on about:blank
+                    try:
+                        WebDriverWait(self.driver, 2, poll_frequency=0.2).until(
+                            lambda d: d.current_url != 'about:blank'
+                        )
+                    except TimeoutException:
+                        pass
+                    new_url = self.driver.current_url
+                    if self._is_valid_pdf_url(new_url) or self._is_pdf_page():
+                        pdf_window_url = new_url
+                        break
+                self._close_windows(new_windows, main_window)
+                if pdf_window_url:
+                    return pdf_window_url
             
             # Check if URL changed
             new_url = self.driver.current_url
-            if new_url != current_url:
+            if new_url != url_before_click:
                 if self._is_valid_pdf_url(new_url) or self._is_pdf_page():
                     return new_url
             
@@ -475,7 +950,7 @@ class PDFLinkFinder:
                 return new_url
             
         except Exception as e:
-            logger.debug(f"Click detection failed: {e}")
+            logger.debug("Click detection failed: %s", e)
         
         return None
     
@@ -493,22 +968,19 @@ class PDFLinkFinder:
         try:
             page_source = self.driver.page_source
             
-            # Pattern 1: Direct PDF URLs
-            pdf_pattern = r'https?://[^\s"\'<>]+\.pdf[^\s"\'<>]*'
-            matches = re.findall(pdf_pattern, page_source, re.IGNORECASE)
-            for match in matches:
-                if self._is_valid_pdf_url(match):
-                    return match
+            # Pattern 1: Direct PDF URLs (stop at the first valid one)
+            for match in _PDF_URL_RE.finditer(page_source):
+                if self._is_valid_pdf_url(match.group(0)):
+                    return match.group(0)
             
             # Pattern 2: ScienceDirect PII patterns
-            pii_pattern = r'/science/article/pii/([A-Z0-9]+)'
-            match = re.search(pii_pattern, page_source, re.IGNORECASE)
+            match = _SCIENCEDIRECT_PII_RE.search(page_source)
             if match:
                 pii = match.group(1)
                 pdf_url = f"https://www.sciencedirect.com/science/article/pii/{pii}/pdfft?isDTMRedir=true&download=true"
                 return pdf_url
         except Exception as e:
-            logger.debug(f"Page source scan failed: {e}")
+            logger.debug("Page source scan failed: %s", e)
         
         return None
     
@@ -532,29 +1004,33 @@ class PDFLinkFinder:
     
     def _is_valid_pdf_url(self, url: str) -> bool:
         """Validate that URL looks like a PDF URL."""
-        url_lower = url.lower()
-        
         # Reject obvious non-PDF URLs
-        if url_lower.endswith('/') and url_lower.count('/') <= 4:
+        if url.endswith('/') and url.count('/') <= 4:
             return False  # Homepage
         
         # Accept if it looks like PDF
-        return (
-            url_lower.endswith('.pdf') or
-            '/pdf' in url_lower or
-            '/pdfft' in url_lower or
-            ('.pdf?' in url_lower) or
-            ('sciencedirect.com' in url_lower and '/pii/' in url_lower and '/pdfft' in url_lower)
-        )
+        return _PDF_URL_SHAPE_RE.search(url) is not None
 
 
 class DownloadManager:
     """Handle actual PDF download."""
     
-    def __init__(self, session: requests.Session, rate_limiter: RateLimiter, selenium_download_dir: Optional[Path] = None):
+    def __init__(self, session: requests.Session, rate_limiter: RateLimiter, selenium_download_dir: Optional[Path] = None,
+                 driver_lock: Optional[threading.RLock] = None):
         self.session = session
         self.rate_limiter = rate_limiter
         self.selenium_download_dir = selenium_download_dir
+        # Held only for the Selenium fallback; the HTTP download runs without it
+        self._driver_lock = driver_lock if driver_lock is not None else threading.RLock()
+        # Chrome needs an absolute download path; resolve it once
+        self._selenium_download_dir_str = str(selenium_download_dir.resolve()) if selenium_download_dir else None
+        # Status of the calling thread's last download response
+        self._local = threading.local()
+    
+    @property
+    def last_http_status(self) -> Optional[int]:
+        """HTTP status of this thread's last download() response, if any."""
+        return getattr(self._local, 'http_status', None)
     
     def download(self, pdf_url: str, output_path: Path, 
                  cookies: Optional[List[Dict]] = None,
@@ -573,7 +1049,7 @@ class DownloadManager:
         Returns:
             True if successful
         """
-        domain = urlparse(pdf_url).netloc
+        domain = _netloc(pdf_url)
         self.rate_limiter.wait_if_needed(domain)
         
         # Transfer cookies if provided
@@ -594,6 +1070,7 @@ class DownloadManager:
         if referer:
             headers['Referer'] = referer
         
+        self._local.http_status = None
         try:
             # Download with streaming
             response = self.session.get(
@@ -603,69 +1080,104 @@ class DownloadManager:
                 allow_redirects=True,
                 headers=headers
             )
+            self._local.http_status = response.status_code
             
             # Handle error status codes that might still contain PDF
+            if response.status_code in (429, 503):
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                if response.status_code == 429 or retry_after is not None:
+                    self.rate_limiter.record_throttled(domain, retry_after)
+            elif response.status_code < 400:
+                self.rate_limiter.record_success(domain)
+            
             if response.status_code >= 400:
-                logger.warning(f"Got HTTP {response.status_code}, checking if response is PDF...")
-                # Save to temp file to check
-                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            tmp_file.write(chunk)
-                    tmp_path = Path(tmp_file.name)
-                
-                # Check if it's a PDF
-                if tmp_path.stat().st_size >= 4:
-                    header = tmp_path.read_bytes()[:4]
-                    if header == b'%PDF':
-                        logger.info(f"Got {response.status_code} but response is PDF, saving...")
-                        output_path.parent.mkdir(parents=True, exist_ok=True)
-                        tmp_path.rename(output_path)
-                        return True
+                logger.warning("Got HTTP %s, checking if response is PDF...", response.status_code)
+                if self._save_error_response_if_pdf(response, output_path):
+                    return True
                 
                 # Not a PDF, try Selenium fallback if available
-                tmp_path.unlink()
                 
                 if selenium_driver and response.status_code in (403, 401):
-                    logger.info(f"Trying Selenium fallback for {response.status_code} response...")
-                    return self._download_with_selenium(pdf_url, output_path, selenium_driver, referer)
+                    logger.info("Trying Selenium fallback for %s response...", response.status_code)
+                    with self._driver_lock:
+                        return self._download_with_selenium(pdf_url, output_path, selenium_driver, referer)
                 
                 # If no Selenium or not 403/401, raise error
                 response.raise_for_status()
             
-            # Normal download
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write to temp file first
-            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                tmp_path = Path(tmp_file.name)
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        tmp_file.write(chunk)
-            
-            # Verify PDF header
-            header = tmp_path.read_bytes()[:4]
-            if header != b'%PDF':
-                logger.error(f"Downloaded file is not a valid PDF (header: {header})")
-                tmp_path.unlink()
+            # Verify the PDF header from the first chunk, before writing
+            # anything, so HTML error/paywall pages are not downloaded
+            chunks = response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+            head = _read_stream_head(chunks)
+            if head[:4] != b'%PDF':
+                logger.error("Downloaded file is not a valid PDF (header: %s)", head[:4])
+                response.close()
                 return False
             
-            # Move to final location
-            tmp_path.rename(output_path)
-            logger.info(f"Downloaded {output_path.stat().st_size} bytes to {output_path}")
+            # Normal download, counting bytes so the size needs no stat
+            size = _write_stream_atomically(output_path, head, chunks)
+            logger.info("Downloaded %s bytes to %s", size, output_path)
             return True
             
         except Exception as e:
-            logger.error(f"Download failed: {e}")
+            logger.error("Download failed: %s", e)
             # Try Selenium fallback if available
             if selenium_driver:
                 logger.info("Trying Selenium fallback after requests failure...")
-                return self._download_with_selenium(pdf_url, output_path, selenium_driver, referer)
+                with self._driver_lock:
+                    return self._download_with_selenium(pdf_url, output_path, selenium_driver, referer)
             
-            if output_path.exists():
-                output_path.unlink()
+            # Writes are atomic: a failure leaves no partial file to clean up,
+            # and any PDF already at output_path is kept
             return False
     
+    @staticmethod
+    def _save_error_response_if_pdf(response: requests.Response, output_path: Path) -> bool:
+        """
+        Save an HTTP error response to output_path if its body is a PDF.
+        
+        Only the first bytes are read to decide, so an error page body is
+        never downloaded; the response is closed if it is not a PDF.
+        
+        Returns:
+            True if the response was a PDF and was saved
+        """
+        chunks = response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+        head = _read_stream_head(chunks)
+        
+        if head[:4] != b'%PDF':
+            response.close()
+            return False
+        
+        logger.info("Got %s but response is PDF, saving...", response.status_code)
+        _write_stream_atomically(output_path, head, chunks)
+        return True
+    
+    @staticmethod
+    def _scan_download_dir(download_dir: Path) -> Dict[str, os.stat_result]:
+        """
+        Snapshot the regular files in a download directory.
+        
+        Uses os.scandir so the file-type check is served from the DirEntry
+        and each file is stat'ed once (symlinks are not followed).
+        
+        Returns:
+            Mapping of file name to stat result
+        """
+        files: Dict[str, os.stat_result] = {}
+        try:
+            with os.scandir(download_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        files[entry.name] = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        pass  # File vanished between readdir and stat
+        except OSError as e:
+            logger.debug("Could not scan download directory %s: %s", download_dir, e)
+        return files
+    
     def _wait_for_download(self, download_dir: Optional[Path], timeout: int = 30, expected_filename: Optional[str] = None) -> Optional[Path]:
         """
         Wait for a file to appear in the download directory.
@@ -682,195 +1194,197 @@ class DownloadManager:
             return None
         
         start_time = time.time()
-        initial_files = set(download_dir.glob('*'))
-        initial_file_sizes = {f: f.stat().st_size for f in initial_files if f.is_file()}
-        logger.debug(f"Monitoring download directory: {download_dir}")
-        logger.debug(f"Initial files: {[f.name for f in initial_files]}")
+        initial_files = self._scan_download_dir(download_dir)
+        logger.debug("Monitoring download directory: %s", download_dir)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Initial files: %s", list(initial_files))
         
         # Also check for .crdownload files (Chrome's temporary download files)
         last_check_time = start_time
         
         while time.time() - start_time < timeout:
-            current_files = set(download_dir.glob('*'))
+            current_files = self._scan_download_dir(download_dir)
             
             # Check for .crdownload files (download in progress)
-            crdownload_files = [f for f in current_files if f.is_file() and f.name.endswith('.crdownload')]
+            crdownload_files = [name for name in current_files if name.endswith('.crdownload')]
             if crdownload_files:
-                logger.debug(f"Download in progress: {[f.name for f in crdownload_files]}")
+                logger.debug("Download in progress: %s", crdownload_files)
                 time.sleep(1)
                 continue
             
-            new_files = current_files - initial_files
+            new_files = {name: st for name, st in current_files.items() if name not in initial_files}
             
             # Also check for files that changed size (might be the same file being written)
-            for existing_file in initial_files:
-                if existing_file.is_file() and existing_file in current_files:
+            for name, initial_stat in initial_files.items():
+                current_stat = current_files.get(name)
+                if current_stat is None or current_stat.st_size <= initial_stat.st_size:
+                    continue
+                logger.debug("File %s is growing: %s -> %s", name, initial_stat.st_size, current_stat.st_size)
+                # Wait a bit more to see if it finishes
+                time.sleep(2)
+                # Check if it's now complete (no .crdownload)
+                if name.lower().endswith('.pdf'):
+                    existing_file = download_dir / name
+                    # Verify it's a PDF
                     try:
-                        current_size = existing_file.stat().st_size
-                        initial_size = initial_file_sizes.get(existing_file, 0)
-                        if current_size > initial_size:
-                            logger.debug(f"File {existing_file.name} is growing: {initial_size} -> {current_size}")
-                            # Wait a bit more to see if it finishes
-                            time.sleep(2)
-                            # Check if it's now complete (no .crdownload)
-                            if not existing_file.name.endswith('.crdownload'):
-                                if existing_file.suffix.lower() == '.pdf':
-                                    # Verify it's a PDF
-                                    try:
-                                        header = existing_file.read_bytes()[:4]
-                                        if header == b'%PDF':
-                                            logger.info(f"Found completed PDF: {existing_file.name}")
-                                            return existing_file
-                                    except:
-                                        pass
+                        header = _read_pdf_header(existing_file)
+                        if header == b'%PDF':
+                            logger.info("Found completed PDF: %s", name)
+                            return existing_file
                     except:
                         pass
             
             # Filter for PDF files
-            pdf_files = [f for f in new_files if f.is_file() and f.suffix.lower() == '.pdf']
+            pdf_files = [name for name in new_files if name.lower().endswith('.pdf')]
             
             # Also check for files without extension that might be PDFs
-            for f in new_files:
-                if f.is_file() and not f.suffix:
+            for name in new_files:
+                if not Path(name).suffix:
                     try:
-                        header = f.read_bytes()[:4]
+                        header = _read_pdf_header(download_dir / name)
                         if header == b'%PDF':
-                            logger.info(f"Found PDF without extension: {f.name}")
-                            pdf_files.append(f)
+                            logger.info("Found PDF without extension: %s", name)
+                            pdf_files.append(name)
                     except:
                         pass
             
+            # No .crdownload is left at this point, and Chrome only gives a
+            # download its final name once it is complete, so new PDFs are
+            # returned right away rather than after a settling sleep
+            
             # If we have an expected filename, prefer files matching it
             if expected_filename:
-                matching = [f for f in pdf_files if expected_filename.lower() in f.name.lower()]
+                matching = [name for name in pdf_files if expected_filename.lower() in name.lower()]
                 if matching:
-                    # Wait a bit more to ensure download is complete
-                    time.sleep(1)
                     # Verify it's complete
                     try:
-                        header = matching[0].read_bytes()[:4]
+                        header = _read_pdf_header(download_dir / matching[0])
                         if header == b'%PDF':
-                            return matching[0]
+                            return download_dir / matching[0]
                     except:
                         pass
             
             if pdf_files:
-                # Wait a bit more to ensure download is complete
-                time.sleep(1)
                 # Verify and return the most recently modified PDF
-                for pdf_file in sorted(pdf_files, key=lambda f: f.stat().st_mtime, reverse=True):
+                for name in sorted(pdf_files, key=lambda n: new_files[n].st_mtime, reverse=True):
                     try:
-                        header = pdf_file.read_bytes()[:4]
+                        header = _read_pdf_header(download_dir / name)
                         if header == b'%PDF':
-                            logger.info(f"Found completed PDF: {pdf_file.name}")
-                            return pdf_file
+                            logger.info("Found completed PDF: %s", name)
+                            return download_dir / name
                     except:
                         continue
             
             # Log progress every 5 seconds
             if time.time() - last_check_time >= 5:
-                logger.debug(f"Still waiting for download... ({int(time.time() - start_time)}s elapsed)")
+                logger.debug("Still waiting for download... (%ss elapsed)", int(time.time() - start_time))
                 last_check_time = time.time()
             
             time.sleep(0.5)
         
-        final_files = list(download_dir.glob('*'))
-        logger.warning(f"Download timeout after {timeout}s.")
-        logger.warning(f"Final files in directory ({len(final_files)}): {[f.name for f in final_files]}")
+        logger.warning("Download timeout after %ss.", timeout)
         
-        # Log details about each file
-        for f in final_files:
-            try:
-                size = f.stat().st_size
-                mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                logger.warning(f"  - {f.name}: {size} bytes, modified {mtime}")
+        # Directory listing and file previews are diagnostics only; skip the
+        # scan and file reads entirely when warnings are not emitted
+        if logger.isEnabledFor(logging.WARNING):
+            final_files = self._scan_download_dir(download_dir)
+            logger.warning("Final files in directory (%d): %s", len(final_files), list(final_files))
+            
+            # Log details about each file
+            for name, st in final_files.items():
+                logger.warning("  - %s: %s bytes, modified %s", name, st.st_size, datetime.fromtimestamp(st.st_mtime))
                 # Check if it's HTML (Cloudflare page)
-                if f.suffix == '.html' or f.name.endswith('.html'):
+                if name.endswith('.html'):
                     try:
-                        content_preview = f.read_text()[:200]
-                        logger.warning(f"    Content preview: {content_preview}")
+                        with open(download_dir / name, 'r', errors='replace') as f:
+                            logger.warning("    Content preview: %s", f.read(200))
                     except:
                         pass
-            except Exception as e:
-                logger.warning(f"  - {f.name}: (error reading: {e})")
         
         return None
     
     def _download_with_selenium(self, pdf_url: str, output_path: Path, 
                                 driver, referer: Optional[str] = None) -> bool:
         """Download PDF using Selenium browser download (for watermarking services, etc.)."""
+        from selenium.webdriver.common.by import By
+        
         try:
-            logger.info(f"Downloading via Selenium browser download: {pdf_url}")
+            logger.info("Downloading via Selenium browser download: %s", pdf_url)
             
             # Get list of files before download
-            initial_files = set(self.selenium_download_dir.glob('*'))
-            logger.debug(f"Initial files in download dir: {len(initial_files)}")
+            initial_files = self._scan_download_dir(self.selenium_download_dir)
+            logger.debug("Initial files in download dir: %s", len(initial_files))
             
             # Enable Chrome downloads using DevTools Protocol
             # Must use absolute path
-            download_path = str(self.selenium_download_dir.resolve())
+            download_path = self._selenium_download_dir_str
             try:
                 driver.execute_cdp_cmd('Page.setDownloadBehavior', {
                     'behavior': 'allow',
                     'downloadPath': download_path
                 })
-                logger.debug(f"Enabled Chrome downloads via DevTools Protocol to: {download_path}")
+                logger.debug("Enabled Chrome downloads via DevTools Protocol to: %s", download_path)
             except Exception as e:
-                logger.debug(f"Could not enable downloads via CDP: {e}")
+                logger.debug("Could not enable downloads via CDP: %s", e)
             
             # Navigate to PDF URL - browser will download it automatically
             driver.get(pdf_url)
             time.sleep(3)  # Wait for page to start loading
             
             current_url = driver.current_url
-            logger.info(f"Current URL after navigation: {current_url}")
+            logger.info("Current URL after navigation: %s", current_url)
             
             # Check for Cloudflare challenge
             page_source = driver.page_source
             page_title = driver.title
-            logger.debug(f"Page title: {page_title}")
-            logger.debug(f"Page source length: {len(page_source)}")
-            logger.debug(f"Page source preview (first 500 chars): {page_source[:500]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Page title: %s", page_title)
+                logger.debug("Page source length: %s", len(page_source))
+                logger.debug("Page source preview (first 500 chars): %s", page_source[:500])
             
             # Check for Cloudflare "Just a moment" page
             is_cloudflare = (
-                'just a moment' in page_title.lower() or
-                'just a moment' in page_source.lower()[:2000] or
-                'cloudflare' in page_source.lower()[:2000] or
-                'checking your browser' in page_source.lower()[:2000]
+                _JUST_A_MOMENT_RE.search(page_title) is not None or
+                _CLOUDFLARE_INTERSTITIAL_RE.search(page_source, 0, _INTERSTITIAL_SCAN_HEAD) is not None
             )
             
             if is_cloudflare:
-                logger.warning("=" * 60)
-                logger.warning("CLOUDFLARE CHALLENGE DETECTED")
-                logger.warning(f"Page title: {page_title}")
-                logger.warning("This is blocking the PDF download.")
-                logger.warning("=" * 60)
+                logger.warning(
+                    "%s\nCLOUDFLARE CHALLENGE DETECTED\nPage title: %s\n"
+                    "This is blocking the PDF download.\n%s",
+                    _BANNER_RULE, page_title, _BANNER_RULE
+                )
                 
                 # Wait a bit to see if it resolves
                 logger.info("Waiting for Cloudflare challenge to resolve (max 30s)...")
-                start_wait = time.time()
-                while time.time() - start_wait < 30:
-                    time.sleep(2)
-                    current_page = driver.page_source.lower()
-                    current_title = driver.title.lower()
-                    if 'just a moment' not in current_title and 'just a moment' not in current_page[:2000]:
-                        logger.info("Cloudflare challenge appears to have resolved")
-                        break
-                    logger.debug(f"Still on Cloudflare page... ({int(time.time() - start_wait)}s)")
+                from selenium.webdriver.support.ui import WebDriverWait
+                from selenium.common.exceptions import TimeoutException
+                
+                def challenge_resolved(d) -> bool:
+                    # Title first: while it still reads 'Just a moment' the
+                    # (much larger) page source is not transferred
+                    if _JUST_A_MOMENT_RE.search(d.title):
+                        return False
+                    return not _JUST_A_MOMENT_RE.search(d.page_source, 0, _INTERSTITIAL_SCAN_HEAD)
+                
+                try:
+                    WebDriverWait(driver, 30, poll_frequency=2).until(challenge_resolved)
+                    logger.info("Cloudflare challenge appears to have resolved")
+                except TimeoutException:
+                    logger.debug("Still on Cloudflare page after 30s")
                 
                 # Re-check after waiting
-                page_source = driver.page_source
                 page_title = driver.title
                 current_url = driver.current_url
-                logger.info(f"After Cloudflare wait - URL: {current_url}, Title: {page_title[:100]}")
+                logger.info("After Cloudflare wait - URL: %s, Title: %s", current_url, page_title[:100])
             
             # Log what files are currently in download directory
-            current_files = list(self.selenium_download_dir.glob('*'))
-            logger.debug(f"Files in download directory after navigation: {[f.name for f in current_files]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                current_files = self._scan_download_dir(self.selenium_download_dir)
+                logger.debug("Files in download directory after navigation: %s", list(current_files))
             
             # Check if we're redirected to a watermark page
-            is_watermark = 'silverchair.com' in current_url or 'watermark' in current_url.lower()
+            is_watermark = _WATERMARK_URL_RE.search(current_url) is not None
             
             # Try to force download using JavaScript if it's a direct PDF URL
             if not is_watermark and (current_url.endswith('.pdf') or '/pdf' in current_url.lower()):
@@ -895,7 +1409,7 @@ class DownloadManager:
                     time.sleep(2)
                     logger.info("JavaScript download trigger executed")
                 except Exception as e:
-                    logger.debug(f"JavaScript download trigger failed: {e}")
+                    logger.debug("JavaScript download trigger failed: %s", e)
             
             # If we're on a watermark page, look for download links/buttons
             if is_watermark:
@@ -903,19 +1417,8 @@ class DownloadManager:
                 time.sleep(3)  # Wait for page to fully load
                 
                 # Look for download buttons/links
-                download_selectors = [
-                    "//a[contains(@href, '.pdf')]",
-                    "//a[contains(text(), 'Download')]",
-                    "//button[contains(text(), 'Download')]",
-                    "//a[@download]",
-                    "//*[contains(@class, 'download')]//a",
-                    "//a[contains(@title, 'Download')]",
-                    "//a[contains(@aria-label, 'Download')]",
-                    "//a[contains(@class, 'pdf')]",
-                ]
-                
                 clicked = False
-                for selector in download_selectors:
+                for selector in _WATERMARK_DOWNLOAD_XPATHS:
                     try:
                         elements = driver.find_elements(By.XPATH, selector)
                         for element in elements:
@@ -923,7 +1426,7 @@ class DownloadManager:
                             text = (element.text or "").lower()
                             
                             if href and ('.pdf' in href.lower() or 'download' in text):
-                                logger.info(f"Found download link, clicking: {href or text[:50]}")
+                                logger.info("Found download link, clicking: %s", href or text[:50])
                                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
                                 time.sleep(0.5)
                                 try:
@@ -936,7 +1439,7 @@ class DownloadManager:
                         if clicked:
                             break
                     except Exception as e:
-                        logger.debug(f"Selector {selector} failed: {e}")
+                        logger.debug("Selector %s failed: %s", selector, e)
                         continue
             
             # Wait for download to complete
@@ -945,35 +1448,48 @@ class DownloadManager:
                 return False
             
             # Log current state before waiting
-            logger.info(f"Waiting for browser download to complete...")
-            logger.info(f"Download directory: {self.selenium_download_dir}")
-            logger.info(f"Current page URL: {driver.current_url}")
-            logger.info(f"Current page title: {driver.title}")
+            logger.info("Waiting for browser download to complete...")
+            logger.info("Download directory: %s", self.selenium_download_dir)
+            # URL and title are each a WebDriver round-trip; skip them when not logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Current page URL: %s", driver.current_url)
+                logger.info("Current page title: %s", driver.title)
             
             # Check what's in the download directory now
-            files_before_wait = list(self.selenium_download_dir.glob('*'))
-            logger.debug(f"Files in download directory before wait: {[f.name for f in files_before_wait]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                files_before_wait = self._scan_download_dir(self.selenium_download_dir)
+                logger.debug("Files in download directory before wait: %s", list(files_before_wait))
             
             downloaded_file = self._wait_for_download(self.selenium_download_dir, timeout=30)
             
             if downloaded_file:
-                logger.info(f"Downloaded file found: {downloaded_file}")
+                logger.info("Downloaded file found: %s", downloaded_file)
                 
                 # Verify it's a PDF
                 try:
-                    header = downloaded_file.read_bytes()[:4]
+                    header = _read_pdf_header(downloaded_file)
                     if header != b'%PDF':
-                        logger.error(f"Downloaded file is not a PDF (header: {header})")
+                        logger.error("Downloaded file is not a PDF (header: %s)", header)
                         downloaded_file.unlink()
                         return False
                 except Exception as e:
-                    logger.error(f"Error verifying PDF: {e}")
+                    logger.error("Error verifying PDF: %s", e)
                     return False
                 
-                # Move to final location
+                # Move to final location without ever exposing a partial PDF
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(downloaded_file), str(output_path))
-                logger.info(f"Downloaded PDF moved to: {output_path} ({output_path.stat().st_size} bytes)")
+                try:
+                    # Same filesystem: an atomic rename
+                    os.replace(downloaded_file, output_path)
+                except OSError:
+                    # Different filesystem (the default download dir is a temp
+                    # dir): copy to a temp file next to output_path, then replace
+                    with open(downloaded_file, 'rb') as source:
+                        _write_stream_atomically(
+                            output_path, b'', iter(lambda: source.read(_DOWNLOAD_CHUNK_SIZE), b'')
+                        )
+                    downloaded_file.unlink()
+                logger.info("Downloaded PDF moved to: %s", output_path)
                 return True
             else:
                 logger.warning("No PDF file appeared in download directory")
@@ -982,7 +1498,7 @@ class DownloadManager:
                 return self._save_pdf_from_selenium(driver, output_path)
             
         except Exception as e:
-            logger.error(f"Selenium download failed: {e}", exc_info=True)
+            logger.error("Selenium download failed: %s", e, exc_info=True)
             return False
     
     def _is_pdf_page(self, driver) -> bool:
@@ -1021,18 +1537,20 @@ class DownloadManager:
                 except:
                     pass
         except Exception as e:
-            logger.debug(f"Error checking if PDF page: {e}")
+            logger.debug("Error checking if PDF page: %s", e)
         return False
     
     def _save_pdf_from_selenium(self, driver, output_path: Path) -> bool:
         """Save PDF from current Selenium page."""
+        from selenium.webdriver.common.by import By
+        
         try:
             current_url = driver.current_url
-            logger.info(f"Attempting to save PDF from: {current_url}")
+            logger.info("Attempting to save PDF from: %s", current_url)
             cookies = driver.get_cookies()
             
             # Try to extract actual PDF URL from page if we're on a watermark page
-            if 'silverchair.com' in current_url or 'watermark' in current_url.lower():
+            if _WATERMARK_URL_RE.search(current_url):
                 logger.info("On watermark page, trying to extract PDF URL...")
                 # Look for PDF URL in various places
                 try:
@@ -1040,33 +1558,34 @@ class DownloadManager:
                     iframes = driver.find_elements(By.TAG_NAME, 'iframe')
                     for iframe in iframes:
                         src = iframe.get_attribute('src')
-                        if src and ('.pdf' in src.lower() or 'silverchair' in src.lower()):
-                            logger.info(f"Found PDF URL in iframe: {src}")
+                        if src and _WATERMARK_PDF_SRC_RE.search(src):
+                            logger.info("Found PDF URL in iframe: %s", src)
                             current_url = src
                             break
                     
                     # Check page source for PDF URLs
                     page_source = driver.page_source
-                    pdf_urls = re.findall(r'https?://[^\s"\'<>]+\.pdf[^\s"\'<>]*', page_source, re.IGNORECASE)
-                    for pdf_url in pdf_urls:
+                    for match in _PDF_URL_RE.finditer(page_source):
+                        pdf_url = match.group(0)
                         if 'silverchair' in pdf_url or 'watermark' in pdf_url:
-                            logger.info(f"Found PDF URL in page source: {pdf_url}")
+                            logger.info("Found PDF URL in page source: %s", pdf_url)
                             current_url = pdf_url
                             break
                 except Exception as e:
-                    logger.debug(f"Error extracting PDF URL: {e}")
+                    logger.debug("Error extracting PDF URL: %s", e)
             
-            # Build requests session with cookies from Selenium
-            session = requests.Session()
+            # Browser cookies and headers for this request only; the shared
+            # session keeps its pooled connections and its own cookie jar
+            headers = {}
             try:
-                user_agent = driver.execute_script("return navigator.userAgent;")
-                session.headers.update({'User-Agent': user_agent})
+                headers['User-Agent'] = driver.execute_script("return navigator.userAgent;")
             except:
                 pass
             
+            cookie_jar = requests.cookies.RequestsCookieJar()
             for cookie in cookies:
                 try:
-                    session.cookies.set(
+                    cookie_jar.set(
                         cookie['name'],
                         cookie['value'],
                         domain=cookie.get('domain', ''),
@@ -1079,80 +1598,82 @@ class DownloadManager:
             try:
                 referer = driver.execute_script("return document.referrer;")
                 if referer:
-                    session.headers.update({'Referer': referer})
+                    headers['Referer'] = referer
             except:
                 pass
             
             # Try to download via requests with Selenium cookies
-            logger.info(f"Downloading PDF via requests with Selenium cookies: {current_url}")
-            response = session.get(current_url, stream=True, timeout=60, allow_redirects=True)
+            logger.info("Downloading PDF via requests with Selenium cookies: %s", current_url)
+            response = self.session.get(
+                current_url, stream=True, timeout=60, allow_redirects=True,
+                headers=headers, cookies=cookie_jar
+            )
             
             if response.status_code >= 400:
-                logger.warning(f"Got {response.status_code}, checking if response is PDF...")
-                # Save to temp to check
-                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            tmp_file.write(chunk)
-                    tmp_path = Path(tmp_file.name)
-                
-                if tmp_path.stat().st_size >= 4:
-                    header = tmp_path.read_bytes()[:4]
-                    if header == b'%PDF':
-                        logger.info(f"Got {response.status_code} but response is PDF")
-                        output_path.parent.mkdir(parents=True, exist_ok=True)
-                        tmp_path.rename(output_path)
-                        return True
-                tmp_path.unlink()
+                logger.warning("Got %s, checking if response is PDF...", response.status_code)
+                if self._save_error_response_if_pdf(response, output_path):
+                    return True
                 response.raise_for_status()
             
-            # Normal download
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
-            # Verify
-            header = output_path.read_bytes()[:4]
-            if header == b'%PDF':
-                logger.info(f"Downloaded PDF via Selenium+requests: {output_path.stat().st_size} bytes")
-                return True
-            else:
-                logger.error(f"Downloaded file is not a valid PDF (header: {header})")
-                output_path.unlink()
+            # Verify the header from the first chunk before creating the file
+            chunks = response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+            head = _read_stream_head(chunks)
+            if head[:4] != b'%PDF':
+                logger.error("Downloaded file is not a valid PDF (header: %s)", head[:4])
+                response.close()
                 return False
             
+            # Normal download
+            size = _write_stream_atomically(output_path, head, chunks)
+            
+            logger.info("Downloaded PDF via Selenium+requests: %s bytes", size)
+            return True
+            
         except Exception as e:
-            logger.error(f"Failed to save PDF from Selenium: {e}")
-            if output_path.exists():
-                output_path.unlink()
+            logger.error("Failed to save PDF from Selenium: %s", e)
             return False
 
 
 class MetadataStore:
-    """Manage metadata JSON file."""
+    """
+    Manage metadata JSON file.
+    
+    Every save rewrites the whole file, so updates are buffered and written
+    once per max_pending records; call flush() (or close the owning
+    PDFFetcher) to persist the remainder.
+    """
     
-    def __init__(self, metadata_path: Path):
+    def __init__(self, metadata_path: Path, max_pending: int = 64):
         self.metadata_path = metadata_path
+        self.max_pending = max_pending
         self._metadata: Dict[str, Dict] = {}
+        self._pending = 0
+        # Batch downloads may run concurrently; json.dump must not see a
+        # dict that another thread is mutating
+        self._lock = threading.RLock()
         self._load()
     
     def _load(self):
         """Load metadata from file."""
         if self.metadata_path.exists():
             try:
-                with open(self.metadata_path, 'r') as f:
-                    self._metadata = json.load(f)
+                with open(self.metadata_path, 'rb') as f:
+                    data = f.read()
+                self._metadata = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             except Exception as e:
-                logger.warning(f"Failed to load metadata: {e}")
+                logger.warning("Failed to load metadata: %s", e)
                 self._metadata = {}
     
     def _save(self):
         """Save metadata to file."""
         self.metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.metadata_path, 'w') as f:
-            json.dump(self._metadata, f, indent=2)
+        # The whole file is rewritten on every flush; encode it in one call
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self._metadata, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self._metadata, indent=2).encode('utf-8')
+        with open(self.metadata_path, 'wb') as f:
+            f.write(data)
     
     def get(self, identifier: str) -> Optional[Dict]:
         """Get metadata for identifier."""
@@ -1160,37 +1681,180 @@ class MetadataStore:
     
     def update(self, result: DownloadResult):
         """Update metadata with download result."""
-        identifier = result.identifier
+        with self._lock:
+            self._apply(result, datetime.utcnow().isoformat())
+            self._pending += 1
+            if self._pending >= self.max_pending:
+                self.flush()
+    
+    def update_many(self, results: List[DownloadResult]):
+        """Update metadata with several download results and save once."""
+        # One timestamp for the whole group; they are recorded together
         now = datetime.utcnow().isoformat()
-        
-        if identifier not in self._metadata:
-            self._metadata[identifier] = {
-                'first_attempted': now,
-            }
-        
-        # Add Cloudflare detection flag for easy identification
-        cloudflare_detected = (
-            result.error_reason is not None and 
-            'cloudflare' in result.error_reason.lower()
+        with self._lock:
+            for result in results:
+                self._apply(result, now)
+            self._pending += len(results)
+            self.flush()
+    
+    def flush(self):
+        """Write buffered updates to the metadata file."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._save()
+            self._pending = 0
+    
+    def _apply(self, result: DownloadResult, now: str):
+        """Record a download result in the in-memory metadata, stamped with now."""
+
+        # Assign fields in place on the stored entry rather than building a
+        # temporary dict for .update() on every call
+        entry = self._metadata.setdefault(result.identifier, {'first_attempted': now})
+        entry['last_attempted'] = now
+        entry['status'] = result.status.value
+        entry['publisher'] = result.publisher
+        entry['landing_url'] = result.landing_url
+        entry['pdf_url'] = result.pdf_url
+        entry['sanitized_filename'] = result.sanitized_filename
+        entry['error_reason'] = result.error_reason
+        # Easy to identify Cloudflare aborts
+        entry['cloudflare_detected'] = (
+            result.error_reason is not None and
+            _CLOUDFLARE_REASON_RE.search(result.error_reason) is not None
         )
-        
-        self._metadata[identifier].update({
-            'last_attempted': now,
-            'status': result.status.value,
-            'publisher': result.publisher,
-            'landing_url': result.landing_url,
-            'pdf_url': result.pdf_url,
-            'sanitized_filename': result.sanitized_filename,
-            'error_reason': result.error_reason,
-            'cloudflare_detected': cloudflare_detected,  # Easy to identify Cloudflare aborts
-        })
-        
+
         if result.status == DownloadStatus.SUCCESS:
-            self._metadata[identifier]['last_successful'] = now
+            entry['last_successful'] = now
             if result.pdf_path:
-                self._metadata[identifier]['pdf_path'] = str(result.pdf_path)
+                entry['pdf_path'] = str(result.pdf_path)
+
+
+class ResolutionCache:
+    """
+    Persistent cache for DOI -> landing URL and DOI -> Crossref PDF URL lookups.
+    
+    Backed by SQLite in WAL mode, with a bounded in-memory LRU in front so
+    repeated hits never touch the database. Writes are buffered and committed
+    with executemany on flush(), or automatically once max_pending entries
+    are buffered so callers that never flush stay bounded in memory.
+    
+    Entries loaded from disk expire: positives after ttl seconds (publishers
+    move landing pages and PDFs), negatives sooner, after negative_ttl,
+    since Crossref records gain links over time.
+    
+    With db_path None the database is in memory: lookups are shared by one
+    fetcher's downloads but nothing is written to disk.
+    """
+    
+    TABLES = ('landing', 'crossref_pdf')
+    
+    def __init__(self, db_path: Optional[Path], max_memory_entries: int = 10000, max_pending: int = 1000,
+                 ttl: float = 180 * 24 * 3600, negative_ttl: float = 30 * 24 * 3600):
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._pending_count = 0
+        self._memory: Dict[str, "OrderedDict[str, str]"] = {table: OrderedDict() for table in self.TABLES}
+        self._pending: Dict[str, Dict[str, str]] = {table: {} for table in self.TABLES}
+        
+        # Shared by concurrent batch downloads; every access holds _lock
+        self._lock = threading.RLock()
+        if self.db_path is None:
+            self._db = sqlite3.connect(':memory:', isolation_level=None, check_same_thread=False)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+        for table in self.TABLES:
+            self._db.execute(f'CREATE TABLE IF NOT EXISTS {table}(k TEXT PRIMARY KEY, v TEXT, t REAL)')
+            # Caches written before entries were timestamped lack the t column
+            columns = {row[1] for row in self._db.execute(f'PRAGMA table_info({table})')}
+            if 't' not in columns:
+                self._db.execute(f'ALTER TABLE {table} ADD COLUMN t REAL')
+    
+    def _remember(self, table: str, key: str, value: str):
+        memory = self._memory[table]
+        memory[key] = value
+        memory.move_to_end(key)
+        if len(memory) > self.max_memory_entries:
+            memory.popitem(last=False)
+    
+    def get(self, table: str, key: str) -> Optional[str]:
+        """
+        Get cached value, or None if not cached.
         
-        self._save()
+        An empty string is a cached negative (e.g. Crossref has no PDF link),
+        so callers test `is None` for a miss.
+        """
+        with self._lock:
+            memory = self._memory[table]
+            value = memory.get(key)
+            if value is not None:
+                memory.move_to_end(key)
+                return value
+            
+            value = self._pending[table].get(key)
+            if value is not None:
+                return value
+            
+            row = self._db.execute(f'SELECT v, t FROM {table} WHERE k = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            # Stale (or untimestamped) entries count as a miss and get re-checked
+            max_age = self.negative_ttl if value == '' else self.ttl
+            if stored_at is None or time.time() - stored_at > max_age:
+                return None
+            self._remember(table, key, value)
+            return value
+    
+    def put(self, table: str, key: str, value: str):
+        """Cache value; persisted on the next flush()."""
+        with self._lock:
+            if self._memory[table].get(key) == value:
+                return
+            self._remember(table, key, value)
+            pending = self._pending[table]
+            if key not in pending:
+                self._pending_count += 1
+            pending[key] = value
+            if self._pending_count >= self.max_pending:
+                self.flush()
+    
+    def flush(self):
+        """Write buffered entries to disk in a single transaction."""
+        with self._lock:
+            if not self._pending_count:
+                return
+            now = time.time()
+            try:
+                self._db.execute('BEGIN')
+                for table, rows in self._pending.items():
+                    if rows:
+                        self._db.executemany(
+                            f'INSERT OR REPLACE INTO {table}(k, v, t) VALUES (?, ?, ?)',
+                            [(key, value, now) for key, value in rows.items()]
+                        )
+                self._db.execute('COMMIT')
+            except sqlite3.Error as e:
+                logger.warning("Failed to flush resolution cache: %s", e)
+                try:
+                    self._db.execute('ROLLBACK')
+                except sqlite3.Error:
+                    pass
+            for rows in self._pending.values():
+                rows.clear()
+            self._pending_count = 0
+    
+    def close(self):
+        """Flush pending writes and close the database."""
+        with self._lock:
+            self.flush()
+            self._db.close()
 
 
 class PDFFetcher:
@@ -1198,6 +1862,9 @@ class PDFFetcher:
     Main PDF fetcher class following the specification.
     """
     
+    # Concurrent Crossref lookups when prefetching a batch
+    CROSSREF_PREFETCH_WORKERS = 3
+    
     def __init__(
         self,
         pdf_dir: Union[str, Path] = "./pdfs",
@@ -1208,7 +1875,8 @@ class PDFFetcher:
         user_agent: Optional[str] = None,
         selenium_download_dir: Optional[Union[str, Path]] = None,
         delay_between_requests: float = 2.0,
-        delay_between_batches: float = 10.0
+        delay_between_batches: float = 10.0,
+        cache_path: Optional[Union[str, Path]] = None
     ):
         """
         Initialize PDF fetcher.
@@ -1221,8 +1889,10 @@ class PDFFetcher:
             max_retries: Max retry attempts for network errors
             user_agent: Custom user agent string
             selenium_download_dir: Directory for Selenium browser downloads (defaults to temp dir)
-            delay_between_requests: Delay in seconds between individual requests (helps avoid Cloudflare)
+            delay_between_requests: Minimum seconds between downloads from the same domain (helps avoid Cloudflare)
             delay_between_batches: Delay in seconds between batches (for batch processing)
+            cache_path: SQLite file that keeps resolved landing and Crossref PDF
+                URLs across runs (None = cache in memory for this fetcher only)
         """
         self.pdf_dir = Path(pdf_dir)
         self.pdf_dir.mkdir(parents=True, exist_ok=True)
@@ -1245,18 +1915,15 @@ class PDFFetcher:
             self.selenium_download_dir = Path(tempfile.mkdtemp(prefix='selenium_downloads_')).resolve()
             self._selenium_download_dir_is_temp = True
         self.selenium_download_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Selenium download directory: {self.selenium_download_dir} (temp: {self._selenium_download_dir_is_temp})")
+        self._selenium_download_dir_str = str(self.selenium_download_dir)  # already resolved
+        logger.debug(
+            "Selenium download directory: %s (temp: %s)",
+            self.selenium_download_dir, self._selenium_download_dir_is_temp
+        )
         
         # Setup requests session
         self.session = requests.Session()
-        if user_agent:
-            self.user_agent = user_agent
-        else:
-            self.user_agent = (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36"
-            )
+        self.user_agent = user_agent or _DEFAULT_USER_AGENT
         self.session.headers.update({'User-Agent': self.user_agent})
         
         # Setup retry strategy
@@ -1265,106 +1932,193 @@ class PDFFetcher:
             backoff_factor=1,
             status_forcelist=[500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # A mixed batch touches doi.org, Crossref, many publishers and their
+        # CDN/redirect hosts; with too few host pools the least recently used
+        # is evicted and its keep-alive connections are dropped
+        adapter = HTTPAdapter(
+            pool_connections=32,  # Number of per-host connection pools
+            pool_maxsize=20,      # Max keep-alive connections per pool
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
-        # Selenium driver (lazy initialization)
-        self._driver: Optional[webdriver.Chrome] = None
-        self._driver_initialized = False
+        # Selenium driver (lazy initialization). A WebDriver is not thread
+        # safe: concurrent downloads hold _driver_lock while they drive it,
+        # and only then (reentrant, so components can take it again)
+        self._driver: Optional['webdriver.Chrome'] = None
+        self._driver_lock = threading.RLock()
+        # Guards per-domain start times when batch downloads run concurrently
+        self._pace_lock = threading.Lock()
+        # Set by cancel() or Ctrl-C; wakes pacing/batch waits immediately
+        self._stop_event = threading.Event()
+        
+        # Domains that served a Cloudflare challenge; with postpone_cloudflare,
+        # batch identifiers on these go last. Matched by parent-suffix lookup.
+        self._cloudflare_domains: Set[str] = set()
+        
+        # PDF hosts that refused a Crossref-path download without landing page
+        # cookies; only these get a driver on the Crossref path
+        self._needs_cookies_domains: Set[str] = set()
+        
+        # DOI -> landing URL / Crossref PDF URL cache; persistent only when
+        # the caller names a file, so nothing lands in the PDF directory
+        self.resolution_cache = ResolutionCache(Path(cache_path) if cache_path else None)
         
         # Components
-        self.doi_resolver = DOIResolver(self.session, self.rate_limiter)
-        self.download_manager = DownloadManager(self.session, self.rate_limiter, self.selenium_download_dir)
+        self.doi_resolver = DOIResolver(self.session, self.rate_limiter, self._driver_lock)
+        self.download_manager = DownloadManager(
+            self.session, self.rate_limiter, self.selenium_download_dir, self._driver_lock
+        )
         
-        # Optional Crossref support (for direct PDF URL lookup)
-        self.crossref_fetcher = None
-        if CROSSREF_AVAILABLE:
-            try:
-                self.crossref_fetcher = CrossrefBibliographicFetcher()
-                logger.info("Crossref support enabled - will try Crossref for PDF URLs first")
-            except Exception as e:
-                logger.warning(f"Could not initialize Crossref fetcher: {e} - will skip Crossref lookup")
-                self.crossref_fetcher = None
+        # Optional Crossref support (for direct PDF URL lookup), created on first use
+        self._crossref_fetcher = None
+        self._crossref_initialized = False
+    
+    @property
+    def crossref_fetcher(self):
+        """Crossref fetcher for direct PDF URL lookup, or None if unavailable."""
+        if not self._crossref_initialized:
+            self._crossref_initialized = True
+            if CROSSREF_AVAILABLE:
+                try:
+                    from api_clients.crossref_client import CrossrefBibliographicFetcher
+                    self._crossref_fetcher = CrossrefBibliographicFetcher()
+                    logger.info("Crossref support enabled - will try Crossref for PDF URLs first")
+                except Exception as e:
+                    logger.warning("Could not initialize Crossref fetcher: %s - will skip Crossref lookup", e)
+                    self._crossref_fetcher = None
+        return self._crossref_fetcher
     
-    def _get_driver(self) -> webdriver.Chrome:
+    def _get_driver(self) -> 'webdriver.Chrome':
         """Get or create Selenium driver."""
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium is not available")
         
-        if not self._driver_initialized:
-            options = ChromeOptions()
-            if self.headless:
-                options.add_argument('--headless=new')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument(f'--user-agent={self.user_agent}')
-            options.add_argument('--window-size=1920,1080')
-            
-            # Configure download preferences
-            # Set download directory (must be absolute path)
-            download_dir_str = str(self.selenium_download_dir.resolve())
-            prefs = {
-                "download.default_directory": download_dir_str,
-                "download.prompt_for_download": False,
-                "download.directory_upgrade": True,
-                "plugins.always_open_pdf_externally": True,  # Download PDFs instead of viewing
-                "plugins.plugins_disabled": ["Chrome PDF Viewer"],  # Disable PDF viewer
-            }
-            options.add_experimental_option("prefs", prefs)
-            logger.debug(f"Chrome download directory set to: {download_dir_str}")
-            
-            # Disable PDF viewer
-            options.add_argument('--disable-pdf-viewer')
-            options.add_argument('--disable-extensions')
-            
-            self._driver = webdriver.Chrome(options=options)
-            self._driver_initialized = True
-            logger.info(f"Selenium driver initialized with download directory: {self.selenium_download_dir}")
-        
+        with self._driver_lock:
+            if self._driver is None:
+                from selenium import webdriver
+                from selenium.webdriver.chrome.options import Options as ChromeOptions
+                
+                options = ChromeOptions()
+                if self.headless:
+                    options.add_argument('--headless=new')
+                options.add_argument('--no-sandbox')
+                options.add_argument('--disable-dev-shm-usage')
+                options.add_argument('--disable-blink-features=AutomationControlled')
+                options.add_argument(f'--user-agent={self.user_agent}')
+                options.add_argument('--window-size=1920,1080')
+                
+                # Configure download preferences
+                # Set download directory (must be absolute path)
+                download_dir_str = self._selenium_download_dir_str
+                prefs = {
+                    "download.default_directory": download_dir_str,
+                    "download.prompt_for_download": False,
+                    "download.directory_upgrade": True,
+                    "plugins.always_open_pdf_externally": True,  # Download PDFs instead of viewing
+                    "plugins.plugins_disabled": ["Chrome PDF Viewer"],  # Disable PDF viewer
+                }
+                options.add_experimental_option("prefs", prefs)
+                logger.debug("Chrome download directory set to: %s", download_dir_str)
+                
+                # Disable PDF viewer
+                options.add_argument('--disable-pdf-viewer')
+                options.add_argument('--disable-extensions')
+                
+                self._driver = webdriver.Chrome(options=options)
+                logger.info("Selenium driver initialized with download directory: %s", self.selenium_download_dir)
+            
         return self._driver
     
-    def _is_cloudflare_challenge(self, driver) -> bool:
-        """Check if current page is a Cloudflare challenge."""
+    @staticmethod
+    def _wait_for_page_load(driver, timeout: float = 2.0):
+        """Wait until the document has finished loading, at most timeout seconds."""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
         try:
-            page_source = driver.page_source.lower()
-            title = driver.title.lower()
-            
-            # Check for manual CAPTCHA checkbox
-            has_checkbox = (
-                'i am human' in page_source or
-                'i\'m not a robot' in page_source or
-                'verify you are human' in page_source or
-                'cf-challenge' in page_source or
-                'challenge-platform' in page_source
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script('return document.readyState') == 'complete'
             )
-            
-            # Check for "Just a moment" page
-            is_just_moment = 'just a moment' in title or 'just a moment' in page_source[:2000]
-            
-            # Check for challenge widgets
-            has_challenge_widget = (
-                'cf-chl-widget' in page_source or
-                'cf-turnstile' in page_source
+        except TimeoutException:
+            pass
+    
+    @staticmethod
+    def _get_page_probe(driver) -> Tuple[Optional[str], str, str, bool]:
+        """
+        Fetch what the landing-page checks need in one WebDriver round-trip.
+        
+        The title, the head/tail of the serialized DOM, and whether a paywall
+        phrase occurs anywhere in it (tested in the browser), so the full
+        page_source never crosses the WebDriver connection.
+        
+        Returns:
+            (title, head, tail, paywalled) where tail is empty if the page fits
+            in head, and title is None if it was not fetched (page_source fallback)
+        """
+        try:
+            title, head, tail, paywalled = driver.execute_script(
+                "var h = document.documentElement ? document.documentElement.outerHTML : '';"
+                "var n = arguments[0], t = arguments[1];"
+                "return [document.title, h.substr(0, n), h.length > n ? h.substr(Math.max(n, h.length - t)) : '',"
+                " new RegExp(arguments[2], 'i').test(h)];",
+                _CHALLENGE_SCAN_HEAD, _CHALLENGE_SCAN_TAIL, _PAYWALL_JS_PATTERN
             )
-            
-            return has_checkbox or is_just_moment or has_challenge_widget
-        except:
-            return False
+            return title or '', head or '', tail or '', bool(paywalled)
+        except Exception:
+            page_source = driver.page_source
+            tail = page_source[max(_CHALLENGE_SCAN_HEAD, len(page_source) - _CHALLENGE_SCAN_TAIL):]
+            paywalled = _PAYWALL_RE.search(page_source) is not None
+            return None, page_source[:_CHALLENGE_SCAN_HEAD], tail, paywalled
+    
+    @staticmethod
+    def _is_challenge_probe(driver, title: Optional[str], head: str, tail: str) -> bool:
+        """Check probed page content for a Cloudflare challenge."""
+        # Check for manual CAPTCHA checkbox or challenge widgets in the
+        # head and tail of the page (no lowercased copy of the whole page)
+        if _CLOUDFLARE_CHALLENGE_RE.search(head) or _CLOUDFLARE_CHALLENGE_RE.search(tail):
+            return True
+        
+        # Check for "Just a moment" page
+        if _JUST_A_MOMENT_RE.search(head, 0, _INTERSTITIAL_SCAN_HEAD):
+            return True
+        
+        # Title is only needed when the page source did not decide; it is
+        # a separate WebDriver round-trip unless the probe already has it
+        if title is None:
+            title = driver.title
+        return _JUST_A_MOMENT_RE.search(title) is not None
+    
+    def _classify_landing_page(self, driver) -> Optional[str]:
+        """
+        Classify the loaded landing page from a single probe.
+        
+        Returns:
+            'cloudflare', 'paywall', or None
+        """
+        try:
+            title, head, tail, paywalled = self._get_page_probe(driver)
+        except Exception:
+            return None
+        try:
+            if self._is_challenge_probe(driver, title, head, tail):
+                return 'cloudflare'
+        except Exception:
+            pass
+        return 'paywall' if paywalled else None
     
     def _close_driver(self):
         """Close Selenium driver."""
-        if self._driver and self._driver_initialized:
+        if self._driver is not None:
             try:
                 self._driver.quit()
             except:
                 pass
             self._driver = None
-            self._driver_initialized = False
         
         # Clean up temporary download directory if we created it
-        if hasattr(self, '_selenium_download_dir_is_temp') and self._selenium_download_dir_is_temp:
+        if self._selenium_download_dir_is_temp:
             if self.selenium_download_dir.exists():
                 try:
                     # Remove any remaining files
@@ -1375,12 +2129,228 @@ class PDFFetcher:
                             elif file.is_dir():
                                 shutil.rmtree(file)
                         except Exception as e:
-                            logger.debug(f"Could not remove {file}: {e}")
+                            logger.debug("Could not remove %s: %s", file, e)
                     # Remove the directory itself
                     self.selenium_download_dir.rmdir()
-                    logger.debug(f"Cleaned up temporary download directory: {self.selenium_download_dir}")
+                    logger.debug("Cleaned up temporary download directory: %s", self.selenium_download_dir)
                 except Exception as e:
-                    logger.debug(f"Could not clean up temporary download directory: {e}")
+                    logger.debug("Could not clean up temporary download directory: %s", e)
+    
+    @staticmethod
+    def _normalize_domain_for_matching(domain: str) -> str:
+        """Lowercase domain and strip port and leading 'www.'."""
+        domain = domain.lower().partition(':')[0]
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain
+    
+    def set_postponed_domains(self, domains: List[str]):
+        """
+        Set domains whose identifiers are postponed in batch downloads
+        run with postpone_cloudflare=True.
+        
+        Args:
+            domains: Domains (e.g. known Cloudflare-protected publishers)
+        """
+        self._cloudflare_domains = {self._normalize_domain_for_matching(d) for d in domains if d}
+    
+    def _add_cloudflare_domain(self, domain: str):
+        """Record a domain that served a Cloudflare challenge."""
+        domain = self._normalize_domain_for_matching(domain)
+        if domain:
+            self._cloudflare_domains.add(domain)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _domain_suffixes(domain: str) -> Tuple[str, ...]:
+        """
+        Normalized domain and each parent suffix it can be postponed under.
+        
+        Suffixes need at least two labels so 'aps.org' covers 'link.aps.org'
+        but a bare TLD never matches. Cached per domain: resource URLs on one
+        host share a single suffix tuple.
+        """
+        suffix = PDFFetcher._normalize_domain_for_matching(domain)
+        suffixes = []
+        while '.' in suffix:
+            suffixes.append(suffix)
+            suffix = suffix.partition('.')[2]
+        return tuple(suffixes)
+    
+    @staticmethod
+    @lru_cache(maxsize=100000)
+    def _identifier_domain_suffixes(identifier: str) -> Tuple[str, ...]:
+        """
+        (Predicted) domain suffixes of an identifier.
+        
+        They only depend on the identifier, so batch passes and retries
+        reuse them instead of re-deriving them per postponement check.
+        """
+        try:
+            kind, doi, url = _normalize_identifier(identifier)
+        except ValueError:
+            return ()
+        domain = PDFFetcher._predict_domain_from_doi(doi) or _netloc(url)
+        return PDFFetcher._domain_suffixes(domain)
+    
+    @staticmethod
+    def _domain_key(identifier: str) -> str:
+        """Normalized (predicted) domain of an identifier; '' if unknown."""
+        suffixes = PDFFetcher._identifier_domain_suffixes(identifier)
+        return suffixes[0] if suffixes else ''
+    
+    def _is_postponed(self, identifier: str) -> bool:
+        """Check whether an identifier's (predicted) domain is postponed."""
+        if not self._cloudflare_domains:
+            return False
+        return not self._cloudflare_domains.isdisjoint(self._identifier_domain_suffixes(identifier))
+    
+    @staticmethod
+    def _predict_domain_from_doi(doi: Optional[str]) -> Optional[str]:
+        """
+        Predict the landing page domain of a DOI from its registrant prefix.
+        
+        Not cached itself: it is one dict lookup on the (cached) prefix, and
+        per-identifier callers go through the _identifier_domain_suffixes() memo.
+        """
+        if not doi or not doi.startswith('10.'):
+            return None
+        return _DOI_PREFIX_MAP.get(_extract_doi_prefix(doi))
+    
+    def _sort_identifiers_by_domain(self, identifiers: List[str]) -> List[str]:
+        """
+        Interleave identifiers by (predicted) domain.
+        
+        Consecutive downloads then hit different publishers, so per-domain
+        rate limits overlap instead of stalling on one publisher.
+        """
+        # Group on the same memoized keys the postponement check reads, so
+        # this pre-pass also warms them for the batch loop
+        groups: Dict[str, List[str]] = {}
+        for identifier in identifiers:
+            groups.setdefault(self._domain_key(identifier), []).append(identifier)
+        
+        interleaved = []
+        queues = list(groups.values())
+        for i in range(max((len(q) for q in queues), default=0)):
+            for queue in queues:
+                if i < len(queue):
+                    interleaved.append(queue[i])
+        return interleaved
+    
+    @staticmethod
+    def _sanitized_name(doi: Optional[str], url: str) -> str:
+        """Filename stem for an identifier: sanitized DOI, or URL hash for non-DOI identifiers."""
+        if doi:
+            return IdentifierNormalizer.sanitize_for_filename(doi)
+        # Use hash of URL for non-DOI identifiers
+        return _url_filename_hash(url)
+    
+    def _fetch_crossref_pdf_url(self, doi: str) -> Optional[str]:
+        """
+        Look up the PDF URL for one DOI via the Crossref client.
+        
+        Returns:
+            PDF URL, '' if Crossref has the DOI but no PDF link, or None if
+            the lookup failed
+        """
+        try:
+            metadata = self.crossref_fetcher.fetch_by_doi(doi)
+        except Exception as e:
+            logger.debug("Crossref prefetch failed for %s: %s", doi, e)
+            return None
+        if not metadata:
+            return None
+        return CrossrefPDFExtractor.extract_pdf_url(metadata) or ''
+    
+    def _prefetch_crossref(self, identifiers: List[str]):
+        """
+        Warm the Crossref PDF URL cache for a batch of identifiers.
+        
+        DOIs not already cached are looked up concurrently (bounded by
+        CROSSREF_PREFETCH_WORKERS to stay within Crossref's concurrency
+        limits) through the Crossref client, so download() finds their PDF
+        URLs without a serial round-trip each. The client is only created
+        when there is something to look up.
+        """
+        dois = []
+        seen = set()
+        for identifier in identifiers:
+            try:
+                kind, doi, url = _normalize_identifier(identifier)
+            except ValueError:
+                continue
+            if doi and doi not in seen:
+                seen.add(doi)
+                if self.resolution_cache.get('crossref_pdf', doi) is None:
+                    dois.append(doi)
+        
+        if not dois or self.crossref_fetcher is None:
+            return
+        
+        logger.info("Prefetching Crossref PDF URLs for %s DOIs...", len(dois))
+        found = 0
+        with ThreadPoolExecutor(max_workers=min(self.CROSSREF_PREFETCH_WORKERS, len(dois))) as executor:
+            for doi, pdf_url in zip(dois, executor.map(self._fetch_crossref_pdf_url, dois)):
+                if pdf_url is not None:
+                    self.resolution_cache.put('crossref_pdf', doi, pdf_url)
+                    found += bool(pdf_url)
+        self.resolution_cache.flush()
+        logger.info("Crossref prefetch: %s/%s PDF URLs found", found, len(dois))
+    
+    def _prefilter_existing(self, identifiers: List[str]) -> Tuple[List[Tuple[str, Path]], List[str]]:
+        """
+        Split identifiers into those whose PDF already exists and those to download.
+        
+        The PDF directory is listed once with os.scandir and each expected
+        filename is looked up in that set, so only files that are actually
+        present get opened (and only their 4-byte header is read).
+        
+        Returns:
+            (existing, remaining): (identifier, pdf_path) pairs for PDFs
+            already on disk, and the identifiers still to download
+        """
+        try:
+            with os.scandir(self.pdf_dir) as entries:
+                existing_names = {
+                    entry.name for entry in entries
+                    if entry.name.endswith('.pdf') and entry.is_file()
+                }
+        except OSError as e:
+            logger.warning("Could not list PDF directory %s: %s", self.pdf_dir, e)
+            return [], list(identifiers)
+        
+        candidates = []
+        for identifier in identifiers:
+            try:
+                kind, doi, url = _normalize_identifier(identifier)
+            except ValueError:
+                continue  # download() records the invalid identifier
+            
+            filename = f"{self._sanitized_name(doi, url)}.pdf"
+            if filename in existing_names:
+                candidates.append((identifier, self.pdf_dir / filename))
+        
+        if not candidates:
+            return [], list(identifiers)
+        
+        # Header checks are independent, I/O-bound reads; run them in parallel.
+        # Files failing the check might be corrupted and are re-downloaded.
+        with ThreadPoolExecutor(max_workers=min(16, len(candidates))) as executor:
+            valid = executor.map(_is_valid_pdf_header, [path for _, path in candidates])
+            existing = [candidate for candidate, ok in zip(candidates, valid) if ok]
+        
+        existing_set = {identifier for identifier, _ in existing}
+        remaining = [identifier for identifier in identifiers if identifier not in existing_set]
+        return existing, remaining
+    
+    @staticmethod
+    def _mark_unsuccessful(result: DownloadResult, status: DownloadStatus,
+                           reason: str) -> DownloadResult:
+        """Record an unsuccessful outcome on result and return it."""
+        result.status = status
+        result.error_reason = reason
+        return result
     
     def download(self, identifier: str) -> DownloadResult:
         """
@@ -1392,120 +2362,138 @@ class PDFFetcher:
         Returns:
             DownloadResult with status and details
         """
+        now = datetime.utcnow().isoformat()
         result = DownloadResult(
             identifier=identifier,
-            first_attempted=datetime.utcnow().isoformat(),
-            last_attempted=datetime.utcnow().isoformat()
+            first_attempted=now,
+            last_attempted=now
         )
+        # Bound up front so every exit path can test them directly
+        landing_url = None
+        pdf_url = None
+        # Set by the landing-page strategy only; a driver means cookies are available
+        driver = None
+        # Whether this call holds _driver_lock for the landing page visit
+        # (released before the HTTP download, or on exit)
+        holds_driver = False
+        # Whether DOI resolution went through the browser (left on the landing page)
+        resolved_in_browser = False
         
         try:
             # Normalize identifier
-            kind, doi, url = IdentifierNormalizer.normalize(identifier)
+            try:
+                kind, doi, url = _normalize_identifier(identifier)
+            except ValueError as e:
+                return self._mark_unsuccessful(result, DownloadStatus.INVALID_IDENTIFIER, str(e))
+            is_doi = kind in ('doi', 'doi_url')
             result.identifier = identifier  # Keep original
             
             # Get sanitized filename
-            if doi:
-                sanitized = IdentifierNormalizer.sanitize_for_filename(doi)
-            else:
-                # Use hash of URL for non-DOI identifiers
-                sanitized = hashlib.md5(url.encode()).hexdigest()[:16]
-            
+            sanitized = self._sanitized_name(doi, url)
             result.sanitized_filename = f"{sanitized}.pdf"
             pdf_path = self.pdf_dir / result.sanitized_filename
             
-            # Check if already exists
-            if pdf_path.exists():
-                # Verify it's a valid PDF
-                try:
-                    header = pdf_path.read_bytes()[:4]
-                    if header == b'%PDF':
-                        result.status = DownloadStatus.ALREADY_EXISTS
-                        result.pdf_path = pdf_path
-                        result.last_successful = datetime.utcnow().isoformat()
-                        self.metadata_store.update(result)
-                        logger.info(f"PDF already exists: {pdf_path}")
-                        return result
-                except:
-                    pass  # File might be corrupted, re-download
+            # Check if already exists by opening it directly; a missing file
+            # raises like an unreadable one, so no separate exists() stat.
+            # Only the header is read; an invalid one means re-download.
+            if _is_valid_pdf_header(pdf_path):
+                result.status = DownloadStatus.ALREADY_EXISTS
+                result.pdf_path = pdf_path
+                result.last_successful = now
+                logger.info("PDF already exists: %s", pdf_path)
+                return result
             
             # Resolve to landing URL
             try:
-                if kind in ('doi', 'doi_url'):
-                    # Try requests first
-                    try:
-                        landing_url = self.doi_resolver.resolve(url, use_selenium=False)
-                    except:
-                        # Fall back to Selenium
-                        driver = self._get_driver()
-                        landing_url = self.doi_resolver.resolve(url, use_selenium=True, selenium_driver=driver)
+                if is_doi:
+                    landing_url = self.resolution_cache.get('landing', url)
+                    if landing_url and not _is_doi_host(_netloc(landing_url)):
+                        logger.debug("Landing URL from cache: %s", landing_url)
+                    else:
+                        # Try requests first
+                        try:
+                            landing_url = self.doi_resolver.resolve(url, use_selenium=False)
+                        except:
+                            # Fall back to Selenium (the resolver locks the driver itself)
+                            landing_url = self.doi_resolver.resolve(url, use_selenium=True, selenium_driver=self._get_driver())
+                            resolved_in_browser = True
+                        # A URL still on doi.org means the DOI did not resolve
+                        # (404, stalled redirect); don't pin it in the cache
+                        if not _is_doi_host(_netloc(landing_url)):
+                            self.resolution_cache.put('landing', url, landing_url)
                 else:
                     landing_url = url
                 
                 result.landing_url = landing_url
             except Exception as e:
-                result.status = DownloadStatus.INVALID_IDENTIFIER
-                result.error_reason = f"Failed to resolve identifier: {e}"
-                self.metadata_store.update(result)
-                return result
+                return self._mark_unsuccessful(
+                    result, DownloadStatus.INVALID_IDENTIFIER, f"Failed to resolve identifier: {e}"
+                )
             
             # Detect publisher
-            publisher = PublisherDetector.detect(landing_url)
+            landing_host = _netloc(landing_url)
+            publisher = PublisherDetector.detect_domain(landing_host)
             result.publisher = publisher
             
             # Strategy 1: Try Crossref for direct PDF URL (if DOI and Crossref available)
-            pdf_url = None
-            if kind in ('doi', 'doi_url') and self.crossref_fetcher and doi:
+            # One cache lookup answers both hit and known-negative ('')
+            crossref_cached = None
+            if is_doi and doi:
+                crossref_cached = self.resolution_cache.get('crossref_pdf', doi)
+                if crossref_cached:
+                    pdf_url = crossref_cached
+                    logger.info("✓ Found PDF URL via Crossref (cached): %s", pdf_url)
+            if crossref_cached is None and is_doi and doi and self.crossref_fetcher:
                 try:
-                    logger.info(f"Trying Crossref for PDF URL: {doi}")
+                    logger.info("Trying Crossref for PDF URL: %s", doi)
                     metadata = self.crossref_fetcher.fetch_by_doi(doi)
                     if metadata:
                         pdf_url = CrossrefPDFExtractor.extract_pdf_url(metadata)
                         if pdf_url:
-                            logger.info(f"✓ Found PDF URL via Crossref: {pdf_url}")
+                            logger.info("✓ Found PDF URL via Crossref: %s", pdf_url)
+                            self.resolution_cache.put('crossref_pdf', doi, pdf_url)
                             # Use the Crossref PDF URL directly - bypass landing page
                             result.landing_url = landing_url  # Keep original landing URL for reference
                             # Skip landing page navigation - proceed directly to download
                         else:
                             logger.debug("Crossref metadata found but no PDF URL available")
+                            self.resolution_cache.put('crossref_pdf', doi, '')
                     else:
                         logger.debug("Crossref did not return metadata for this DOI")
                 except Exception as e:
-                    logger.debug(f"Crossref lookup failed: {e} - falling back to landing page")
-                    pdf_url = None
+                    logger.debug("Crossref lookup failed: %s - falling back to landing page", e)
             
             # Strategy 2: Find PDF URL from landing page (if Crossref didn't provide one)
-            driver = None
             if not pdf_url:
                 logger.info("Finding PDF URL from landing page...")
+                if not holds_driver:
+                    holds_driver = self._driver_lock.acquire()
                 driver = self._get_driver()
-                driver.get(landing_url)
-                time.sleep(2)  # Wait for page load
+                # A browser-resolved DOI already followed the redirect chain
+                # to this page; don't load it a second time
+                if not (resolved_in_browser and driver.current_url == landing_url):
+                    driver.get(landing_url)
+                self._wait_for_page_load(driver)
                 
                 # Check for Cloudflare challenge - if detected, log and skip
-                if self._is_cloudflare_challenge(driver):
-                    logger.warning("=" * 60)
-                    logger.warning("CLOUDFLARE CHALLENGE DETECTED - SKIPPING")
-                    logger.warning(f"Identifier: {identifier}")
-                    logger.warning(f"Resource URL: {landing_url}")
-                    logger.warning(f"Publisher: {publisher or 'unknown'}")
-                    logger.warning("=" * 60)
+                page_kind = self._classify_landing_page(driver)
+                if page_kind == 'cloudflare':
+                    logger.warning(
+                        "%s\nCLOUDFLARE CHALLENGE DETECTED - SKIPPING\n"
+                        "Identifier: %s\nResource URL: %s\nPublisher: %s\n%s",
+                        _BANNER_RULE, identifier, landing_url, publisher or 'unknown', _BANNER_RULE
+                    )
                     
-                    result.status = DownloadStatus.FAILURE
-                    result.error_reason = f"Cloudflare challenge - Resource URL: {landing_url}, Publisher: {publisher or 'unknown'}"
-                    self.metadata_store.update(result)
-                    return result
+                    self._add_cloudflare_domain(landing_host)
+                    
+                    return self._mark_unsuccessful(
+                        result, DownloadStatus.FAILURE,
+                        f"Cloudflare challenge - Resource URL: {landing_url}, Publisher: {publisher or 'unknown'}"
+                    )
                 
                 # Check for paywall indicators
-                page_text = driver.page_source.lower()
-                paywall_indicators = [
-                    'purchase pdf', 'subscription required', 'sign in to access',
-                    'institutional access required', 'pay per view'
-                ]
-                if any(indicator in page_text for indicator in paywall_indicators):
-                    result.status = DownloadStatus.PAYWALL
-                    result.error_reason = "Paywall detected"
-                    self.metadata_store.update(result)
-                    return result
+                if page_kind == 'paywall':
+                    return self._mark_unsuccessful(result, DownloadStatus.PAYWALL, "Paywall detected")
                 
                 # Find PDF link from landing page
                 finder = PDFLinkFinder(driver, self.rate_limiter)
@@ -1513,13 +2501,11 @@ class PDFFetcher:
             
             # If we still don't have a PDF URL, fail
             if not pdf_url:
-                result.status = DownloadStatus.FAILURE
-                if self.crossref_fetcher and kind in ('doi', 'doi_url'):
-                    result.error_reason = "Could not find PDF link (tried Crossref and landing page)"
+                if is_doi and self.crossref_fetcher:
+                    reason = "Could not find PDF link (tried Crossref and landing page)"
                 else:
-                    result.error_reason = "Could not find PDF link"
-                self.metadata_store.update(result)
-                return result
+                    reason = "Could not find PDF link"
+                return self._mark_unsuccessful(result, DownloadStatus.FAILURE, reason)
             
             result.pdf_url = pdf_url
             
@@ -1528,22 +2514,40 @@ class PDFFetcher:
             # In that case, we don't have cookies or driver context
             cookies = None
             driver_for_download = None
+            pdf_host = _netloc(pdf_url)
+            if not driver and pdf_host in self._needs_cookies_domains:
+                # This host refused a cookie-less Crossref download before;
+                # visit the landing page first for cookies and a Selenium fallback
+                logger.info("%s needs landing page cookies, visiting %s", pdf_host, landing_url)
+                if not holds_driver:
+                    holds_driver = self._driver_lock.acquire()
+                driver = self._get_driver()
+                driver.get(landing_url)
+                self._wait_for_page_load(driver)
+            
             if driver:
                 # We visited the landing page - get cookies and driver
+                from selenium.common.exceptions import WebDriverException
                 try:
                     cookies = driver.get_cookies()
                     driver_for_download = driver
-                except:
-                    pass
+                except WebDriverException as e:
+                    logger.debug("Could not read landing page cookies: %s", e)
             else:
                 # We got PDF URL from Crossref - no landing page visit needed
                 logger.debug("Using Crossref PDF URL - no landing page cookies available")
             
+            # The HTTP download, its pacing and backoff don't need the browser;
+            # the download manager re-takes the lock for its Selenium fallback
+            if holds_driver:
+                self._driver_lock.release()
+                holds_driver = False
+            
             success = self.download_manager.download(
                 pdf_url, 
                 pdf_path, 
                 cookies=cookies,
-                referer=landing_url if landing_url else None,  # Pass referer for watermarking services
+                referer=landing_url or None,  # Pass referer for watermarking services
                 selenium_driver=driver_for_download  # Pass driver for Selenium fallback
             )
             
@@ -1552,24 +2556,41 @@ class PDFFetcher:
                 result.pdf_path = pdf_path
                 result.last_successful = datetime.utcnow().isoformat()
             else:
-                result.status = DownloadStatus.FAILURE
-                result.error_reason = "Download failed or file is not a valid PDF"
+                http_status = self.download_manager.last_http_status
+                # Gone at the source (404/410): final, a retry cannot bring it back
+                if http_status in (404, 410):
+                    result.status = DownloadStatus.PDF_NOT_FOUND
+                else:
+                    result.status = DownloadStatus.FAILURE
+                if http_status is not None and http_status >= 400:
+                    result.error_reason = f"Download failed: HTTP {http_status}"
+                else:
+                    result.error_reason = "Download failed or file is not a valid PDF"
+                if driver_for_download is None and http_status in (401, 403):
+                    # Cookie-less download refused; retries for this host get cookies
+                    self._needs_cookies_domains.add(pdf_host)
             
-            self.metadata_store.update(result)
             return result
             
         except Exception as e:
-            logger.error(f"Error downloading PDF: {e}", exc_info=True)
-            result.status = DownloadStatus.FAILURE
-            result.error_reason = str(e)
+            logger.error("Error downloading PDF: %s", e, exc_info=True)
+            return self._mark_unsuccessful(result, DownloadStatus.FAILURE, str(e))
+        finally:
+            if holds_driver:
+                self._driver_lock.release()
+            # Single exit point: every outcome is recorded exactly once
             self.metadata_store.update(result)
-            return result
     
     def download_batch(
         self, 
         identifiers: List[str], 
         batch_size: int = 10,
-        retry_failures: bool = True
+        retry_failures: bool = True,
+        prefilter: bool = False,
+        sort_by_domain: bool = False,
+        prefetch_crossref: bool = False,
+        max_workers: int = 1,
+        postpone_cloudflare: bool = False
     ) -> List[DownloadResult]:
         """
         Download PDFs for multiple identifiers with batching and retry support.
@@ -1578,68 +2599,247 @@ class PDFFetcher:
             identifiers: List of DOIs, DOI-URLs, or resource URLs
             batch_size: Number of downloads per batch (smaller = less likely to trigger Cloudflare)
             retry_failures: Whether to retry failed downloads at the end
+            prefilter: Skip identifiers whose PDF already exists in one directory
+                scan up front, instead of download()'s per-identifier check
+            sort_by_domain: Interleave downloads by publisher domain to spread load
+                (only the download order changes, not the order of the results)
+            prefetch_crossref: Look up Crossref PDF URLs for all DOIs concurrently
+                up front (CROSSREF_PREFETCH_WORKERS connections) instead of one
+                at a time in download()
+            max_workers: Downloads run concurrently within a batch and in the
+                retry pass (1 = sequential).
+                Same-domain pacing still applies, and Selenium work is serialized
+                because there is a single browser.
+            postpone_cloudflare: Download identifiers on domains that served a
+                Cloudflare challenge (earlier, or via set_postponed_domains)
+                after all batches instead of in their batch
         
         Returns:
-            List of DownloadResult objects
+            List of DownloadResult objects, in the order of identifiers
         """
         results = []
-        total = len(identifiers)
-        
-        logger.info(f"Starting batch download: {total} identifiers, batch size: {batch_size}")
+        # Pre-filtering, domain sorting and postponement reorder the work;
+        # results are put back in input order before returning
+        input_position: Dict[str, int] = {}
+        for position, identifier in enumerate(identifiers):
+            input_position.setdefault(identifier, position)
+        # Read once; the loops below consult them per identifier
+        request_delay = self.delay_between_requests
+        batch_delay = self.delay_between_batches
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        futures = []
+        interrupted = False
+        self._stop_event.clear()
         
-        # Process in batches
-        for batch_start in range(0, total, batch_size):
-            batch_end = min(batch_start + batch_size, total)
-            batch = identifiers[batch_start:batch_end]
-            batch_num = (batch_start // batch_size) + 1
-            total_batches = (total + batch_size - 1) // batch_size
-            
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} items)")
-            
-            for i, identifier in enumerate(batch, 1):
-                logger.info(f"[{batch_start + i}/{total}] Downloading: {identifier}")
-                result = self.download(identifier)
-                results.append(result)
+        try:
+            if prefilter:
+                existing_ids, identifiers = self._prefilter_existing(identifiers)
+                if existing_ids:
+                    logger.info("Pre-filter: %s PDFs already exist, %s to download", len(existing_ids), len(identifiers))
                 
-                # Delay between requests within batch
-                if i < len(batch):
-                    time.sleep(self.delay_between_requests)
-            
-            # Delay between batches
-            if batch_end < total:
-                logger.info(f"Batch {batch_num} complete. Waiting {self.delay_between_batches}s before next batch...")
-                time.sleep(self.delay_between_batches)
-        
-        # Retry failures if requested
-        if retry_failures:
-            failures = [r for r in results if r.status == DownloadStatus.FAILURE]
-            if failures:
-                logger.info(f"Retrying {len(failures)} failed downloads with longer delays...")
-                time.sleep(self.delay_between_batches * 2)  # Longer delay before retries
+                # Paths come from the pre-filter; no need to re-derive filenames
+                now = datetime.utcnow().isoformat()
+                for identifier, pdf_path in existing_ids:
+                    results.append(DownloadResult(
+                        identifier=identifier,
+                        sanitized_filename=pdf_path.name,
+                        status=DownloadStatus.ALREADY_EXISTS,
+                        pdf_path=pdf_path,
+                        first_attempted=now,
+                        last_attempted=now,
+                        last_successful=now
+                    ))
+                self.metadata_store.update_many(results)
+            
+            if sort_by_domain:
+                identifiers = self._sort_identifiers_by_domain(identifiers)
+            
+            if prefetch_crossref and identifiers and CROSSREF_AVAILABLE:
+                self._prefetch_crossref(identifiers)
+            
+            total = len(identifiers)
+            
+            logger.info("Starting batch download: %s identifiers, batch size: %s", total, batch_size)
+            
+            # Identifiers on Cloudflare-challenged domains, processed after all batches
+            postponed = []
+            # Monotonic start time of the latest download per (predicted) domain
+            last_started: Dict[str, float] = {}
+            
+            # Process in batches
+            for batch_start in range(0, total, batch_size):
+                if self._stop_event.is_set():
+                    logger.info("Batch download cancelled")
+                    break
+                batch_end = min(batch_start + batch_size, total)
+                batch = identifiers[batch_start:batch_end]
+                batch_num = (batch_start // batch_size) + 1
+                total_batches = (total + batch_size - 1) // batch_size
                 
-                for result in failures:
-                    logger.info(f"Retrying: {result.identifier}")
-                    retry_result = self.download(result.identifier)
-                    # Update the original result
-                    result.status = retry_result.status
-                    result.error_reason = retry_result.error_reason
-                    result.pdf_path = retry_result.pdf_path
-                    result.last_successful = retry_result.last_successful
-                    time.sleep(self.delay_between_requests * 2)  # Longer delay for retries
+                logger.info("Processing batch %s/%s (%s items)", batch_num, total_batches, len(batch))
+                
+                futures = []
+                for i, identifier in enumerate(batch, 1):
+                    if postpone_cloudflare and self._is_postponed(identifier):
+                        logger.info("[%s/%s] Postponing (Cloudflare domain): %s", batch_start + i, total, identifier)
+                        postponed.append(identifier)
+                        continue
+                    
+                    logger.info("[%s/%s] Downloading: %s", batch_start + i, total, identifier)
+                    # Delay between requests to the same domain
+                    if executor is None:
+                        results.append(self._download_paced(identifier, last_started, request_delay))
+                    else:
+                        futures.append(executor.submit(self._download_paced, identifier, last_started, request_delay))
+                
+                # Collected in submission order, so results keep the input order
+                results.extend(future.result() for future in futures)
+                
+                # Persist resolutions and results gathered during this batch
+                self._flush_pending()
+                
+                # Delay between batches
+                if batch_end < total:
+                    logger.info("Batch %s complete. Waiting %ss before next batch...", batch_num, batch_delay)
+                    self._stop_event.wait(batch_delay)
+            
+            # Postponed identifiers go last, after a batch-length pause
+            if postponed and not self._stop_event.is_set():
+                logger.info("Processing %s postponed identifiers after %ss...", len(postponed), batch_delay)
+                self._stop_event.wait(batch_delay)
+                for i, identifier in enumerate(postponed, 1):
+                    logger.info("[postponed %s/%s] Downloading: %s", i, len(postponed), identifier)
+                    results.append(self._download_paced(identifier, last_started, request_delay))
+                self._flush_pending()
+            
+            # Retry failures if requested
+            if retry_failures and not self._stop_event.is_set():
+                # Keyed by identifier so an identifier listed twice is retried once.
+                # Only retry failures that can change on a second attempt.
+                failures: Dict[str, List[DownloadResult]] = {}
+                for r in results:
+                    if self._is_retryable(r):
+                        failures.setdefault(r.identifier, []).append(r)
+                if failures:
+                    logger.info("Retrying %s failed downloads with longer delays...", len(failures))
+                    self._stop_event.wait(batch_delay * 2)  # Longer delay before retries
+                    
+                    retry_started: Dict[str, float] = {}
+                    # Retries on different hosts run concurrently like the batches
+                    futures = []
+                    retried = []
+                    for identifier, failed in failures.items():
+                        logger.info("Retrying: %s", identifier)
+                        # Longer, jittered delay for retries so they don't
+                        # arrive at a struggling host in lockstep
+                        retry_delay = request_delay * 2 * random.uniform(1.0, 1.5)
+                        if executor is None:
+                            retried.append((failed, self._download_paced(identifier, retry_started, retry_delay)))
+                        else:
+                            futures.append(executor.submit(self._download_paced, identifier, retry_started, retry_delay))
+                            retried.append((failed, futures[-1]))
+                    
+                    for failed, outcome in retried:
+                        retry_result = outcome if executor is None else outcome.result()
+                        if retry_result.status == DownloadStatus.CANCELLED:
+                            # Never attempted; the original failure stands
+                            continue
+                        # Update the original result(s)
+                        for result in failed:
+                            result.status = retry_result.status
+                            result.error_reason = retry_result.error_reason
+                            result.pdf_path = retry_result.pdf_path
+                            result.last_successful = retry_result.last_successful
+        except KeyboardInterrupt:
+            # Wake worker threads waiting on pacing so shutdown is prompt
+            interrupted = True
+            self._stop_event.set()
+            raise
+        finally:
+            if executor is not None:
+                # Drop queued downloads. On Ctrl-C don't block on the ones in
+                # progress: they finish (and record their outcome) in the background
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=not interrupted)
+            # Buffered metadata and resolutions survive an interrupted batch
+            self._flush_pending()
         
         # Summary
-        success_count = sum(1 for r in results if r.status == DownloadStatus.SUCCESS)
-        failure_count = sum(1 for r in results if r.status == DownloadStatus.FAILURE)
-        already_exists = sum(1 for r in results if r.status == DownloadStatus.ALREADY_EXISTS)
+        counts = Counter(r.status for r in results)
+        success_count = counts[DownloadStatus.SUCCESS]
+        already_exists = counts[DownloadStatus.ALREADY_EXISTS]
+        # Every other attempted outcome (failure, paywall, not found, ...) failed
+        failure_count = len(results) - success_count - already_exists - counts[DownloadStatus.CANCELLED]
         
-        logger.info(f"Batch download complete: {success_count} succeeded, {already_exists} already existed, {failure_count} failed")
+        logger.info("Batch download complete: %s succeeded, %s already existed, %s failed", success_count, already_exists, failure_count)
+        if counts[DownloadStatus.CANCELLED]:
+            logger.info("%s downloads cancelled before they started", counts[DownloadStatus.CANCELLED])
         
+        results.sort(key=lambda r: input_position[r.identifier])
         return results
     
+    @staticmethod
+    def _is_retryable(result: DownloadResult) -> bool:
+        """
+        Check whether a result is worth retrying.
+        
+        Decided on the recorded status alone: only FAILURE is retried.
+        Paywalls, unsupported identifiers (INVALID_IDENTIFIER) and PDFs the
+        server reported as gone (PDF_NOT_FOUND, from HTTP 404/410) are final.
+        """
+        return result.status == DownloadStatus.FAILURE
+    
+    def _pace_domain(self, domain: str, last_started: Dict[str, float], interval: float):
+        """
+        Sleep until interval seconds have passed since the last download
+        started on domain, then record this start.
+        
+        Time already spent downloading counts towards the interval, and
+        identifiers on other domains do not wait at all.
+        """
+        with self._pace_lock:
+            now = time.monotonic()
+            last = last_started.get(domain)
+            start = now if last is None else max(now, last + interval)
+            # Reserve the slot before sleeping so concurrent callers queue up
+            last_started[domain] = start
+        if start > now:
+            self._stop_event.wait(start - now)
+    
+    def _download_paced(self, identifier: str, last_started: Dict[str, float],
+                        interval: float) -> DownloadResult:
+        """Download identifier once its domain's pacing interval has passed."""
+        self._pace_domain(self._domain_key(identifier), last_started, interval)
+        if self._stop_event.is_set():
+            return DownloadResult(identifier=identifier, status=DownloadStatus.CANCELLED, error_reason="Cancelled")
+        return self.download(identifier)
+    
+    def cancel(self):
+        """
+        Stop a running download_batch from another thread.
+        
+        Pending waits return at once and no further downloads start;
+        downloads already in progress finish normally. Identifiers that
+        were waiting to start come back as CANCELLED and are not recorded.
+        """
+        self._stop_event.set()
+    
+    def _flush_pending(self):
+        """Persist buffered metadata and resolution cache writes."""
+        self.metadata_store.flush()
+        self.resolution_cache.flush()
+    
     def close(self):
         """Close resources."""
-        self._close_driver()
+        # driver.quit() can take seconds; let the browser shut down while
+        # metadata and the resolution cache are written out
+        driver_closer = threading.Thread(target=self._close_driver, name='pdf-fetcher-driver-quit', daemon=True)
+        driver_closer.start()
+        self.metadata_store.flush()
+        self.resolution_cache.close()
         self.session.close()
+        driver_closer.join()
     
     def __enter__(self):
         """Context manager entry."""
@@ -83,61 +83,71 @@ def create_download_summary_log(results, log_dir: Path):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     summary_file = log_dir / f"download_summary_{timestamp}.log"
     
+    # Group results by status in one pass
+    by_status = {}
+    for r in results:
+        by_status.setdefault(r.status.value, []).append(r)
+    successes = by_status.get('success', [])
+    failures = by_status.get('failure', [])
+    paywalls = by_status.get('paywall', [])
+    
+    # Statistics
+    total = len(results)
+    success = len(successes)
+    already_exists = len(by_status.get('already_exists', []))
+    failure = len(failures)
+    paywall = len(paywalls)
+    
+    # Build the whole report, then write it in one go
+    lines = [
+        "PDF Fetcher v2 - Download Summary",
+        f"Generated: {datetime.now().isoformat()}",
+        "=" * 80,
+        "",
+        "STATISTICS",
+        "-" * 80,
+        f"Total: {total}",
+        f"Success: {success}",
+        f"Already exists: {already_exists}",
+        f"Failures: {failure}",
+        f"Paywalls: {paywall}",
+        f"Success rate: {(success / total * 100) if total > 0 else 0:.1f}%",
+        "",
+    ]
+    
+    # Successful downloads
+    if success > 0:
+        lines.append(f"SUCCESSFUL DOWNLOADS ({success})")
+        lines.append("-" * 80)
+        for r in successes:
+            lines.append(f"✓ {r.identifier}")
+            lines.append(f"  Path: {r.pdf_path}")
+            if r.publisher:
+                lines.append(f"  Publisher: {r.publisher}")
+            lines.append("")
+    
+    # Failures
+    if failure > 0:
+        lines.append(f"FAILURES ({failure})")
+        lines.append("-" * 80)
+        for r in failures:
+            lines.append(f"✗ {r.identifier}")
+            lines.append(f"  Reason: {r.error_reason}")
+            if r.landing_url:
+                lines.append(f"  URL: {r.landing_url}")
+            lines.append("")
+    
+    # Paywalls
+    if paywall > 0:
+        lines.append(f"PAYWALLS ({paywall})")
+        lines.append("-" * 80)
+        for r in paywalls:
+            lines.append(f"⚠ {r.identifier}")
+            if r.landing_url:
+                lines.append(f"  URL: {r.landing_url}")
+            lines.append("")
+    
     with open(summary_file, 'w') as f:
-        f.write(f"PDF Fetcher v2 - Download Summary\n")
-        f.write(f"Generated: {datetime.now().isoformat()}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # Statistics
-        total = len(results)
-        success = sum(1 for r in results if r.status.value == 'success')
-        already_exists = sum(1 for r in results if r.status.value == 'already_exists')
-        failure = sum(1 for r in results if r.status.value == 'failure')
-        paywall = sum(1 for r in results if r.status.value == 'paywall')
-        
-        f.write(f"STATISTICS\n")
-        f.write(f"-" * 80 + "\n")
-        f.write(f"Total: {total}\n")
-        f.write(f"Success: {success}\n")
-        f.write(f"Already exists: {already_exists}\n")
-        f.write(f"Failures: {failure}\n")
-        f.write(f"Paywalls: {paywall}\n")
-        f.write(f"Success rate: {(success / total * 100) if total > 0 else 0:.1f}%\n")
-        f.write("\n")
-        
-        # Successful downloads
-        if success > 0:
-            f.write(f"SUCCESSFUL DOWNLOADS ({success})\n")
-            f.write(f"-" * 80 + "\n")
-            for r in results:
-                if r.status.value == 'success':
-                    f.write(f"✓ {r.identifier}\n")
-                    f.write(f"  Path: {r.pdf_path}\n")
-                    if r.publisher:
-                        f.write(f"  Publisher: {r.publisher}\n")
-                    f.write("\n")
-        
-        # Failures
-        if failure > 0:
-            f.write(f"FAILURES ({failure})\n")
-            f.write(f"-" * 80 + "\n")
-            for r in results:
-                if r.status.value == 'failure':
-                    f.write(f"✗ {r.identifier}\n")
-                    f.write(f"  Reason: {r.error_reason}\n")
-                    if r.landing_url:
-                        f.write(f"  URL: {r.landing_url}\n")
-                    f.write("\n")
-        
-        # Paywalls
-        if paywall > 0:
-            f.write(f"PAYWALLS ({paywall})\n")
-            f.write(f"-" * 80 + "\n")
-            for r in results:
-                if r.status.value == 'paywall':
-                    f.write(f"⚠ {r.identifier}\n")
-                    if r.landing_url:
-                        f.write(f"  URL: {r.landing_url}\n")
-                    f.write("\n")
+        f.write("\n".join(lines) + "\n")
     
     return summary_file